@@ -1,5 +1,6 @@
 """Configuration settings for FinSim API."""
 
+import os
 from functools import lru_cache
 
 from pydantic_settings import BaseSettings
@@ -22,6 +23,15 @@ class Settings(BaseSettings):
     default_n_simulations: int = 10_000
     max_n_simulations: int = 100_000
 
+    # States whose PolicyEngine simulations are built at startup
+    tax_warm_states: list[str] = ["CA"]
+    # Worker processes for API simulation runs. Each loads its own
+    # PolicyEngine tax-benefit system (hundreds of MB), so the default is
+    # one per CPU capped at 4.
+    simulation_workers: int = min(os.cpu_count() or 1, 4)
+    # Seconds to wait at startup for every worker to finish warming up
+    simulation_warmup_timeout: float = 300.0
+
     # CORS — production origins only; localhost is handled via regex in main.py
     cors_origins: list[str] = [
         "https://app.eggnest.co",
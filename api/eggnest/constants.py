@@ -55,6 +55,12 @@ STATE_FIPS: dict[str, int] = {
     "WY": 56,
 }
 
+# States that tax none of wages, capital gains or dividends. WA (capital gains
+# excise) and NH (interest and dividends tax through 2024) are left out.
+NO_INCOME_TAX_STATES: frozenset[str] = frozenset(
+    {"AK", "FL", "NV", "SD", "TN", "TX", "WY"}
+)
+
 # Filing status mapping for PolicyEngine dataset (numeric codes for Microsimulation)
 FILING_STATUS_PE_DATASET: dict[str, int] = {
     "SINGLE": 1,
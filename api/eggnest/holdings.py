@@ -24,6 +24,13 @@ WITHDRAWAL_ORDER = {
     "roth_first": [ROTH_ACCOUNTS, TAXABLE_ACCOUNTS, TRADITIONAL_ACCOUNTS],
 }
 
+# Key for each category in withdrawal results
+CATEGORY_KEYS = {
+    TAXABLE_ACCOUNTS: "taxable",
+    TRADITIONAL_ACCOUNTS: "traditional",
+    ROTH_ACCOUNTS: "roth",
+}
+
 
 @dataclass
 class HoldingState:
@@ -40,8 +47,9 @@ class HoldingsTracker:
     """
     Tracks portfolio holdings through a Monte Carlo simulation.
 
-    Each holding has its own balance array and fund-specific returns.
-    Handles RMDs for traditional accounts and withdrawal ordering.
+    Holding balances are rows of one (n_holdings, n_simulations) matrix,
+    grown with fund-specific returns. Handles RMDs for traditional accounts
+    and withdrawal ordering.
     """
 
     def __init__(
@@ -67,46 +75,89 @@ class HoldingsTracker:
         self.n_simulations = n_simulations
         self.n_years = n_years
         self.withdrawal_strategy = withdrawal_strategy
+        # Resolve the strategy once rather than every simulated year: None
+        # for pro rata, otherwise the (category, result key) sequence
+        self._withdrawal_order = (
+            None
+            if withdrawal_strategy == "pro_rata"
+            else [
+                (category, CATEGORY_KEYS[category])
+                for category in WITHDRAWAL_ORDER.get(
+                    withdrawal_strategy, WITHDRAWAL_ORDER["taxable_first"]
+                )
+            ]
+        )
         self._rng = rng or np.random.default_rng()
 
-        # Generate returns for each unique fund (shared across holdings with same fund)
+        # Generate returns for each unique fund (shared across holdings with
+        # same fund), in first-appearance order (not set order, which varies
+        # with string hashing) so seeded runs draw them in a stable order.
+        # They're written straight into year-major (n_years, n_funds,
+        # n_simulations) arrays through transposed views, so each year's
+        # returns for every fund are one contiguous slice. Returns and
+        # balances are float32 like the simulator's paths; sampling error
+        # across simulations dwarfs single-precision rounding.
+        funds = list(dict.fromkeys(h.fund for h in holdings))
+        shape = (n_years, len(funds), n_simulations)
+        self._price_by_year = np.empty(shape, dtype=np.float32)
+        self._div_by_year = np.empty(shape, dtype=np.float32)
         self._fund_returns: dict[str, tuple[np.ndarray, np.ndarray]] = {}
-        unique_funds = {h.fund for h in holdings}
-        for fund in unique_funds:
-            price_growth, div_yields = generate_fund_returns(
+        for k, fund in enumerate(funds):
+            self._fund_returns[fund] = generate_fund_returns(
                 fund=fund,
                 n_simulations=n_simulations,
                 n_years=n_years,
                 method=return_method,
                 rng=self._rng,
+                out_price=self._price_by_year[:, k].T,
+                out_div=self._div_by_year[:, k].T,
             )
-            self._fund_returns[fund] = (price_growth, div_yields)
-
-        # Create holding states
-        self.holdings: list[HoldingState] = []
-        for h in holdings:
-            price_growth, div_yields = self._fund_returns[h.fund]
-            self.holdings.append(
-                HoldingState(
-                    account_type=h.account_type,
-                    fund=h.fund,
-                    balance=np.full(n_simulations, h.balance, dtype=float),
-                    price_growth=price_growth,
-                    div_yields=div_yields,
-                )
+
+        # Holding state as structure-of-arrays: one (n_holdings, n_simulations)
+        # balance matrix, and each holding's fund as an index into the per-year
+        # return slices, so every update is a single operation over all holdings
+        self._fund_idx = np.array(
+            [funds.index(h.fund) for h in holdings], dtype=np.intp
+        )
+        initial = np.array([h.balance for h in holdings], dtype=np.float32)
+        self.balances = np.repeat(initial[:, None], n_simulations, axis=1)
+
+        # Per-holding views; balance rows alias self.balances
+        self.holdings: list[HoldingState] = [
+            HoldingState(
+                account_type=h.account_type,
+                fund=h.fund,
+                balance=self.balances[i],
+                price_growth=self._fund_returns[h.fund][0],
+                div_yields=self._fund_returns[h.fund][1],
             )
+            for i, h in enumerate(holdings)
+        ]
+
+        # Rows of each account category, resolved once rather than by
+        # scanning account types on every balance, dividend and withdrawal
+        self._category_idx: dict[tuple[str, ...], np.ndarray] = {}
+        for category in (TRADITIONAL_ACCOUNTS, ROTH_ACCOUNTS, TAXABLE_ACCOUNTS):
+            self._category_idx[category] = self._rows_in(category)
+
+    def _rows_in(self, category: tuple[str, ...]) -> np.ndarray:
+        """Balance-matrix rows of holdings whose account type is in category."""
+        idx = self._category_idx.get(category)
+        if idx is None:
+            idx = np.array(
+                [i for i, h in enumerate(self.holdings) if h.account_type in category],
+                dtype=np.intp,
+            )
+        return idx
 
     @property
     def total_balance(self) -> np.ndarray:
         """Total portfolio balance across all holdings (n_simulations,)."""
-        return sum(h.balance for h in self.holdings)
+        return self.balances.sum(axis=0)
 
     def get_balance_by_account_category(self, category: tuple[str, ...]) -> np.ndarray:
         """Get total balance for an account category (n_simulations,)."""
-        balances = [h.balance for h in self.holdings if h.account_type in category]
-        if balances:
-            return sum(balances)
-        return np.zeros(self.n_simulations)
+        return self.balances[self._rows_in(category)].sum(axis=0)
 
     @property
     def traditional_balance(self) -> np.ndarray:
@@ -125,9 +176,8 @@ class HoldingsTracker:
 
     def apply_growth(self, year: int) -> None:
         """Apply one year of growth to all holdings."""
-        for h in self.holdings:
-            growth = h.balance * h.price_growth[:, year]
-            h.balance = h.balance + growth
+        growth = self.balances * self._price_by_year[year][self._fund_idx]
+        self.balances += growth
 
     def get_dividends(self, year: int) -> dict[str, np.ndarray]:
         """
@@ -137,23 +187,16 @@ class HoldingsTracker:
             Dict with keys 'traditional', 'roth', 'taxable' containing
             dividend amounts (n_simulations,) for each category.
         """
-        result = {
-            "traditional": np.zeros(self.n_simulations),
-            "roth": np.zeros(self.n_simulations),
-            "taxable": np.zeros(self.n_simulations),
+        divs = self.balances * self._div_by_year[year][self._fund_idx]
+        return {
+            key: divs[self._category_idx[category]].sum(axis=0)
+            for key, category in (
+                ("traditional", TRADITIONAL_ACCOUNTS),
+                ("roth", ROTH_ACCOUNTS),
+                ("taxable", TAXABLE_ACCOUNTS),
+            )
         }
 
-        for h in self.holdings:
-            divs = h.balance * h.div_yields[:, year]
-            if h.account_type in TRADITIONAL_ACCOUNTS:
-                result["traditional"] += divs
-            elif h.account_type in ROTH_ACCOUNTS:
-                result["roth"] += divs
-            else:
-                result["taxable"] += divs
-
-        return result
-
     def calculate_rmd(self, age: int) -> np.ndarray:
         """
         Calculate Required Minimum Distribution for traditional accounts.
@@ -200,62 +243,60 @@ class HoldingsTracker:
             "total": np.zeros(self.n_simulations),
         }
 
-        remaining = amount.copy()
-
-        # Step 1: Handle RMDs first (must be taken from traditional)
-        rmd = self.calculate_rmd(age)
-        rmd_withdrawal = np.minimum(rmd, self.traditional_balance)
-        self._withdraw_from_category(TRADITIONAL_ACCOUNTS, rmd_withdrawal)
+        # Step 1: Handle RMDs first (must be taken from traditional). Each
+        # category total is summed once and handed to the withdrawal, rather
+        # than re-summed from the balance matrix at every step.
+        trad_balance = self.traditional_balance
+        rmd_withdrawal = np.minimum(self.calculate_rmd(age), trad_balance)
+        if rmd_withdrawal.any():
+            self._withdraw_from_category(
+                TRADITIONAL_ACCOUNTS, rmd_withdrawal, trad_balance
+            )
+            trad_balance = trad_balance - rmd_withdrawal
         result["traditional_rmd"] = rmd_withdrawal
-        remaining = np.maximum(0, remaining - rmd_withdrawal)
+        remaining = np.maximum(0, amount - rmd_withdrawal)
 
         # Step 2: If RMD exceeds spending need, we're done (excess stays in taxable)
         # Otherwise, continue with withdrawal strategy
+        cat_balances = {
+            "taxable": self.taxable_balance,
+            "traditional": trad_balance,
+            "roth": self.roth_balance,
+        }
 
-        if self.withdrawal_strategy == "pro_rata":
+        if self._withdrawal_order is None:
             # Withdraw proportionally from all account types
             # Calculate proportions based on CURRENT balances (after RMD)
-            total_bal = self.total_balance
-            # Store the amount to distribute (before any withdrawals in this step)
-            amount_to_distribute = remaining.copy()
-
-            for category, key in [
-                (TAXABLE_ACCOUNTS, "taxable"),
-                (TRADITIONAL_ACCOUNTS, "traditional"),
-                (ROTH_ACCOUNTS, "roth"),
-            ]:
-                cat_balance = self.get_balance_by_account_category(category)
-                # Proportion of portfolio in this category
-                proportion = np.where(total_bal > 0, cat_balance / total_bal, 0)
-                # Use original amount_to_distribute for all categories (not decremented remaining)
-                withdrawal = np.minimum(amount_to_distribute * proportion, cat_balance)
-                self._withdraw_from_category(category, withdrawal)
-                result[key] += withdrawal
-
-            # Update remaining after all pro-rata withdrawals
-            remaining = np.maximum(
-                0,
-                remaining
-                - (result["taxable"] + result["traditional"] + result["roth"]),
+            total_bal = (
+                cat_balances["taxable"]
+                + cat_balances["traditional"]
+                + cat_balances["roth"]
             )
+
+            for category, key in CATEGORY_KEYS.items():
+                cat_balance = cat_balances[key]
+                # Proportion of portfolio in this category
+                proportion = np.divide(
+                    cat_balance,
+                    total_bal,
+                    out=np.zeros(self.n_simulations),
+                    where=total_bal > 0,
+                )
+                # Every category shares the same (pre-withdrawal) remaining need
+                withdrawal = np.minimum(remaining * proportion, cat_balance)
+                self._withdraw_from_category(category, withdrawal, cat_balance)
+                result[key] = withdrawal
         else:
             # Sequential withdrawal based on strategy
-            order = WITHDRAWAL_ORDER.get(
-                self.withdrawal_strategy, WITHDRAWAL_ORDER["taxable_first"]
-            )
-            for category in order:
-                if category == TAXABLE_ACCOUNTS:
-                    key = "taxable"
-                elif category == TRADITIONAL_ACCOUNTS:
-                    key = "traditional"
-                else:
-                    key = "roth"
-
-                cat_balance = self.get_balance_by_account_category(category)
+            for category, key in self._withdrawal_order:
+                cat_balance = cat_balances[key]
                 withdrawal = np.minimum(remaining, cat_balance)
-                self._withdraw_from_category(category, withdrawal)
-                result[key] += withdrawal
+                self._withdraw_from_category(category, withdrawal, cat_balance)
+                result[key] = withdrawal
                 remaining = np.maximum(0, remaining - withdrawal)
+                if not remaining.any():
+                    # Every path's need is met; later categories stay zero
+                    break
 
         result["total"] = (
             result["traditional_rmd"]
@@ -269,6 +310,7 @@ class HoldingsTracker:
         self,
         category: tuple[str, ...],
         amount: np.ndarray,
+        cat_total: np.ndarray | None = None,
     ) -> None:
         """
         Withdraw amount from holdings in a category (pro-rata within category).
@@ -276,23 +318,27 @@ class HoldingsTracker:
         Args:
             category: Account types to withdraw from
             amount: Amount to withdraw (n_simulations,)
+            cat_total: Category balance (n_simulations,), if already known
         """
-        # Get holdings in this category
-        cat_holdings = [h for h in self.holdings if h.account_type in category]
-        if not cat_holdings:
+        rows = self._rows_in(category)
+        if not len(rows):
             return
 
-        # Calculate total balance in category
-        cat_total = sum(h.balance for h in cat_holdings)
-
-        # Withdraw pro-rata from each holding
-        for h in cat_holdings:
-            # Avoid division by zero - use np.divide with where parameter
-            proportion = np.divide(
-                h.balance, cat_total, out=np.zeros_like(h.balance), where=cat_total > 0
-            )
-            withdrawal = amount * proportion
-            h.balance = np.maximum(0, h.balance - withdrawal)
+        cat_balances = self.balances[rows]
+        if cat_total is None:
+            cat_total = cat_balances.sum(axis=0)
+
+        # Withdrawing pro-rata takes the same fraction of every holding in the
+        # category, so one (n_simulations,) divide covers all rows. Avoid
+        # division by zero - use np.divide with where parameter
+        fraction = np.divide(
+            amount,
+            cat_total,
+            out=np.zeros(self.n_simulations),
+            where=cat_total > 0,
+        )
+        cat_balances -= cat_balances * fraction
+        self.balances[rows] = np.maximum(0, cat_balances)
 
 
 def create_holdings_tracker(
@@ -1,5 +1,6 @@
 """Mortality tables and survival calculations from SSA Period Life Tables."""
 
+from functools import lru_cache
 from typing import Literal
 
 import numpy as np
@@ -71,32 +72,52 @@ FEMALE_MORTALITY = {
 }
 
 
+# Sorted (ages, rates) arrays for each table, built once for vectorized lookups
+_MORTALITY_ARRAYS: dict[str, tuple[np.ndarray, np.ndarray]] = {
+    gender: (np.array(sorted(table)), np.array([table[a] for a in sorted(table)]))
+    for gender, table in (("male", MALE_MORTALITY), ("female", FEMALE_MORTALITY))
+}
+
+
 def get_mortality_rates(gender: Literal["male", "female"]) -> dict[int, float]:
     """Get mortality rates by age for given gender."""
     return MALE_MORTALITY if gender == "male" else FEMALE_MORTALITY
 
 
-def interpolate_mortality_rate(age: int, gender: Literal["male", "female"]) -> float:
-    """Get interpolated mortality rate for a specific age."""
-    mortality_rates = get_mortality_rates(gender)
-    ages = sorted(mortality_rates.keys())
-    rates = [mortality_rates[a] for a in ages]
-    return float(np.interp(age, ages, rates))
+def tabulated_mortality_rates(
+    ages: np.ndarray | list[int], gender: Literal["male", "female"]
+) -> np.ndarray:
+    """Get the table rate in effect at each age (the nearest tabulated age below)."""
+    table_ages, rates = _MORTALITY_ARRAYS[gender]
+    idx = np.searchsorted(table_ages, ages, side="right") - 1
+    return rates[np.maximum(idx, 0)]
+
+
+def interpolate_mortality_rate(
+    age: int | np.ndarray, gender: Literal["male", "female"]
+) -> float | np.ndarray:
+    """Get interpolated mortality rate for a specific age (or array of ages)."""
+    table_ages, rates = _MORTALITY_ARRAYS[gender]
+    if np.ndim(age):
+        return np.interp(age, table_ages, rates)
+    return float(np.interp(age, table_ages, rates))
+
+
+@lru_cache(maxsize=128)
+def _survival_curve(
+    start_age: int, end_age: int, gender: Literal["male", "female"]
+) -> tuple[float, ...]:
+    """Cached survival curve; a tuple so callers can't mutate the cache."""
+    mort_rates = interpolate_mortality_rate(np.arange(start_age, end_age), gender)
+    return (1.0, *np.cumprod(1 - mort_rates).tolist())
 
 
 def calculate_survival_curve(
     start_age: int, end_age: int, gender: Literal["male", "female"]
 ) -> list[float]:
     """Calculate cumulative survival probability from start_age to each age."""
-    survival = [1.0]  # Probability of surviving to start_age is 1
-    cumulative = 1.0
-
-    for age in range(start_age, end_age):
-        mort_rate = interpolate_mortality_rate(age, gender)
-        cumulative *= 1 - mort_rate
-        survival.append(cumulative)
-
-    return survival
+    # Probability of surviving to start_age is 1
+    return list(_survival_curve(start_age, end_age, gender))
 
 
 def generate_alive_mask(
@@ -105,24 +126,37 @@ def generate_alive_mask(
     current_age: int,
     gender: Literal["male", "female"],
     rng: np.random.Generator,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Generate a boolean mask indicating if the person is alive at each year.
 
+    Args:
+        out: Optional preallocated (n_years + 1, n_simulations) bool array
+            to fill instead of allocating a new mask.
+
     Returns:
-        Array of shape (n_simulations, n_years + 1) where True means alive.
+        Array of shape (n_years + 1, n_simulations) where True means alive.
+        Year-major, so each year's mask is a contiguous row.
     """
-    alive_mask = np.ones((n_simulations, n_years + 1), dtype=bool)
+    if out is None:
+        out = np.empty((n_years + 1, n_simulations), dtype=bool)
+    alive_mask = out
+    alive_mask[0] = True
 
-    for year in range(n_years):
-        age = current_age + year
-        mort_rate = interpolate_mortality_rate(age, gender)
+    # One float32 uniform per simulation per year, drawn into a reused buffer
+    draws = np.empty(n_simulations, dtype=np.float32)
 
-        # Generate random deaths
-        deaths = rng.random(n_simulations) < mort_rate
+    # Python floats, so each comparison against the float32 draws stays float32
+    mort_rates = interpolate_mortality_rate(
+        np.arange(current_age, current_age + n_years), gender
+    ).tolist()
 
-        # Once dead, stay dead
-        alive_mask[deaths, year + 1 :] = False
+    for year, mort_rate in enumerate(mort_rates):
+        # Survive this year's draw; once dead, stay dead
+        rng.random(dtype=np.float32, out=draws)
+        np.greater_equal(draws, mort_rate, out=alive_mask[year + 1])
+        alive_mask[year + 1] &= alive_mask[year]
 
     return alive_mask
 
@@ -141,7 +175,7 @@ def generate_joint_alive_mask(
 
     Returns:
         Tuple of (primary_alive, spouse_alive, either_alive) arrays.
-        Each array has shape (n_simulations, n_years + 1).
+        Each array has shape (n_years + 1, n_simulations).
     """
     primary_alive = generate_alive_mask(
         n_simulations, n_years, primary_age, primary_gender, rng
@@ -12,6 +12,7 @@ Returns are stored as:
 - Dividend returns: Income component (taxed as qualified dividends)
 """
 
+from functools import lru_cache
 from typing import Literal
 
 import numpy as np
@@ -541,6 +542,7 @@ BND_PRICE_RETURNS = {
 SP500_PRICE_ARRAY = np.array(list(SP500_PRICE_RETURNS.values()))
 SP500_DIVIDEND_ARRAY = np.array(list(SP500_DIVIDEND_RETURNS.values()))
 SP500_YEARS = np.array(list(SP500_PRICE_RETURNS.keys()))
+SP500_TOTAL_RETURN_ARRAY = SP500_PRICE_ARRAY + SP500_DIVIDEND_ARRAY
 
 # Treasury
 TREASURY_PRICE_ARRAY = np.array(list(TREASURY_RETURNS.values()))
@@ -555,7 +557,7 @@ BND_PRICE_ARRAY = np.array(list(BND_PRICE_RETURNS.values()))
 BND_DIVIDEND_ARRAY = np.array(list(BND_DIVIDEND_YIELDS.values()))
 
 # Legacy aliases for backward compatibility
-RETURNS_ARRAY = SP500_PRICE_ARRAY + SP500_DIVIDEND_ARRAY  # Total returns
+RETURNS_ARRAY = SP500_TOTAL_RETURN_ARRAY  # Total returns
 RETURNS_YEARS = SP500_YEARS
 HISTORICAL_REAL_RETURNS = SP500_PRICE_RETURNS  # Legacy name
 BOND_RETURNS_ARRAY = TREASURY_PRICE_ARRAY  # Legacy name
@@ -569,6 +571,26 @@ FUND_ARRAYS = {
 }
 
 
+def _zeros_or(out: np.ndarray | None, n_simulations: int, n_years: int) -> np.ndarray:
+    """Return out zero-filled, or a new (n_simulations, n_years) zeros array."""
+    if out is None:
+        return np.zeros((n_simulations, n_years))
+    out.fill(0)
+    return out
+
+
+def _take(
+    values: np.ndarray, indices: np.ndarray, out: np.ndarray | None
+) -> np.ndarray:
+    """values.take(indices, out=out), allowing an out of another dtype."""
+    if out is None or out.dtype == values.dtype:
+        return values.take(indices, out=out)
+    # take() round-trips a mismatched out through a float64 copy of its
+    # uninitialized contents; a plain assignment just casts the result.
+    out[...] = values[indices]
+    return out
+
+
 def generate_fund_returns(
     fund: Literal["vt", "sp500", "bnd", "treasury"],
     n_simulations: int,
@@ -576,6 +598,8 @@ def generate_fund_returns(
     method: Literal["bootstrap", "block_bootstrap"] = "bootstrap",
     block_size: int = 5,
     rng: np.random.Generator | None = None,
+    out_price: np.ndarray | None = None,
+    out_div: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Generate returns for a specific fund using bootstrap sampling.
@@ -587,6 +611,8 @@ def generate_fund_returns(
         method: Bootstrap method
         block_size: Block size for block bootstrap
         rng: Random number generator
+        out_price, out_div: Optional (n_simulations, n_years) arrays, of any
+            memory layout, to fill and return instead of allocating
 
     Returns:
         (price_growth, dividend_yields) arrays of shape (n_simulations, n_years)
@@ -599,11 +625,14 @@ def generate_fund_returns(
 
     if method == "bootstrap":
         indices = rng.integers(0, n_historical, size=(n_simulations, n_years))
-        return price_array[indices], div_array[indices]
+        return (
+            _take(price_array, indices, out_price),
+            _take(div_array, indices, out_div),
+        )
 
     elif method == "block_bootstrap":
-        price_growth = np.zeros((n_simulations, n_years))
-        div_returns = np.zeros((n_simulations, n_years))
+        price_growth = _zeros_or(out_price, n_simulations, n_years)
+        div_returns = _zeros_or(out_div, n_simulations, n_years)
         n_blocks = (n_years + block_size - 1) // block_size
 
         for sim in range(n_simulations):
@@ -626,7 +655,13 @@ def generate_fund_returns(
 
 def get_historical_stats() -> dict:
     """Get summary statistics for historical returns."""
-    sp500_total = SP500_PRICE_ARRAY + SP500_DIVIDEND_ARRAY
+    # The tables are fixed at import, so the stats are computed once
+    return dict(_historical_stats())
+
+
+@lru_cache(maxsize=1)
+def _historical_stats() -> dict:
+    sp500_total = SP500_TOTAL_RETURN_ARRAY
     vt_total = VT_PRICE_ARRAY + VT_DIVIDEND_ARRAY
     treasury_total = TREASURY_PRICE_ARRAY + TREASURY_YIELD_ARRAY
     bnd_total = BND_PRICE_ARRAY + BND_DIVIDEND_ARRAY
@@ -787,10 +822,16 @@ def generate_blended_returns(
     stock_index: Literal["sp500", "vt"] = "vt",
     bond_index: Literal["treasury", "bnd"] = "bnd",
     rng: np.random.Generator | None = None,
+    out_price: np.ndarray | None = None,
+    out_div: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Generate blended stock/bond returns with separate price and dividend components.
 
+    Args:
+        out_price, out_div: Optional (n_simulations, n_years) arrays, of any
+            memory layout, to fill and return instead of allocating
+
     Returns:
         (price_growth, dividend_yields) - blended based on allocation
     """
@@ -813,23 +854,20 @@ def generate_blended_returns(
     if method == "bootstrap":
         indices = rng.integers(0, n_historical, size=(n_simulations, n_years))
 
-        # Blend price returns
-        blended_price = (
-            stock_allocation * stock_price[indices]
-            + bond_allocation * bond_price[indices]
-        )
-
-        # Blend dividend yields
-        blended_div = (
-            stock_allocation * stock_div[indices] + bond_allocation * bond_div[indices]
+        # Blend price returns and dividend yields, writing into out if given
+        blended_price = np.multiply(
+            stock_allocation, stock_price[indices], out=out_price
         )
+        blended_price += bond_allocation * bond_price[indices]
+        blended_div = np.multiply(stock_allocation, stock_div[indices], out=out_div)
+        blended_div += bond_allocation * bond_div[indices]
 
         return blended_price, blended_div
 
     elif method == "block_bootstrap":
         n_blocks = (n_years + block_size - 1) // block_size
-        blended_price = np.zeros((n_simulations, n_years))
-        blended_div = np.zeros((n_simulations, n_years))
+        blended_price = _zeros_or(out_price, n_simulations, n_years)
+        blended_div = _zeros_or(out_div, n_simulations, n_years)
 
         for sim in range(n_simulations):
             year_idx = 0
@@ -851,8 +889,8 @@ def generate_blended_returns(
         return blended_price, blended_div
 
     elif method == "historical":
-        blended_price = np.zeros((n_simulations, n_years))
-        blended_div = np.zeros((n_simulations, n_years))
+        blended_price = _zeros_or(out_price, n_simulations, n_years)
+        blended_div = _zeros_or(out_div, n_simulations, n_years)
         start_indices = rng.integers(0, n_historical, size=n_simulations)
 
         for sim in range(n_simulations):
@@ -872,24 +910,36 @@ def generate_blended_returns(
         avg_stock_div = float(np.mean(stock_div))
         avg_bond_div = float(np.mean(bond_div))
 
-        stock_price_ret = rng.normal(
-            expected_stock_return - avg_stock_div,
-            stock_volatility,
-            size=(n_simulations, n_years),
-        )
-        bond_price_ret = rng.normal(
-            expected_bond_return - avg_bond_div,
-            bond_volatility,
-            size=(n_simulations, n_years),
-        )
-
-        blended_price = (
-            stock_allocation * stock_price_ret + bond_allocation * bond_price_ret
-        )
-        blended_div = np.full(
-            (n_simulations, n_years),
-            stock_allocation * avg_stock_div + bond_allocation * avg_bond_div,
+        # Stock and bond noise are independent normals, so their weighted sum
+        # is one normal with the combined standard deviation. Draw it as
+        # float32 and scale in place, straight into a contiguous float32
+        # out_price of either layout (the simulator passes a year-major
+        # buffer's transpose); other out_price arrays get one copy.
+        shape = (n_simulations, n_years)
+        if (
+            out_price is not None
+            and out_price.dtype == np.float32
+            and (out_price.flags.c_contiguous or out_price.flags.f_contiguous)
+        ):
+            rng.standard_normal(dtype=np.float32, out=out_price)
+            blended_price = out_price
+        else:
+            blended_price = rng.standard_normal(shape, dtype=np.float32)
+        blended_price *= np.hypot(
+            stock_allocation * stock_volatility, bond_allocation * bond_volatility
         )
+        blended_price += stock_allocation * (expected_stock_return - avg_stock_div)
+        blended_price += bond_allocation * (expected_bond_return - avg_bond_div)
+        if out_price is not None and blended_price is not out_price:
+            out_price[...] = blended_price
+            blended_price = out_price
+
+        div_yield = stock_allocation * avg_stock_div + bond_allocation * avg_bond_div
+        if out_div is None:
+            blended_div = np.full(shape, div_yield)
+        else:
+            blended_div = out_div
+            blended_div.fill(div_yield)
 
         return blended_price, blended_div
 
@@ -67,6 +67,36 @@ UNIFORM_LIFETIME_TABLE = {
 RMD_START_AGE = 73
 
 
+# RMD factor (1 / distribution period) for each age from the start age on,
+# computed once so the per-year lookup is a single dict access
+RMD_FACTORS = {
+    age: 1.0 / period
+    for age, period in UNIFORM_LIFETIME_TABLE.items()
+    if age >= RMD_START_AGE
+}
+
+
+def get_rmd_divisor(age: int) -> float:
+    """
+    Get the Uniform Lifetime Table distribution period for an age.
+
+    Args:
+        age: Current age (72 or older; ages past 120 use the age-120 period)
+
+    Returns:
+        Distribution period to divide the account balance by.
+
+    Raises:
+        ValueError: If age is below the first age in the table.
+    """
+    if age < min(UNIFORM_LIFETIME_TABLE):
+        raise ValueError(
+            f"No Uniform Lifetime Table period for age {age}; "
+            f"the table starts at {min(UNIFORM_LIFETIME_TABLE)}"
+        )
+    return UNIFORM_LIFETIME_TABLE[min(age, 120)]
+
+
 def calculate_rmd(account_balance: float, age: int) -> float:
     """
     Calculate Required Minimum Distribution for a given age.
@@ -84,10 +114,7 @@ def calculate_rmd(account_balance: float, age: int) -> float:
     if account_balance <= 0:
         return 0.0
 
-    # Get distribution period, use max age if beyond table
-    distribution_period = UNIFORM_LIFETIME_TABLE.get(age, UNIFORM_LIFETIME_TABLE[120])
-
-    return account_balance / distribution_period
+    return account_balance / get_rmd_divisor(age)
 
 
 def get_rmd_factor(age: int) -> float:
@@ -101,8 +128,4 @@ def get_rmd_factor(age: int) -> float:
         Factor to multiply by account balance to get RMD.
         Returns 0 if under RMD age.
     """
-    if age < RMD_START_AGE:
-        return 0.0
-
-    distribution_period = UNIFORM_LIFETIME_TABLE.get(age, UNIFORM_LIFETIME_TABLE[120])
-    return 1.0 / distribution_period
+    return RMD_FACTORS.get(min(age, 120), 0.0)
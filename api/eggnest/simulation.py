@@ -1,6 +1,9 @@
 """Monte Carlo simulation engine for retirement planning."""
 
+import os
+from dataclasses import dataclass
 from datetime import datetime
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -13,19 +16,215 @@ from .tax import TaxCalculator
 # Base year for calendar year calculations
 START_YEAR = datetime.now().year
 
+# Percentiles reported for final values and charted paths
+PERCENTILES = (5, 25, 50, 75, 95)
+PERCENTILE_KEYS = tuple(f"p{q}" for q in PERCENTILES)
 
-def _combine_primary_and_spouse(
-    n_sims: int,
-    primary_value: float,
-    spouse_value: float | np.ndarray,
+# Storage dtype for the (n_sims, n_years) path and breakdown matrices. Dollar
+# values reported to the nearest dollar don't need float64; per-path running
+# totals (withdrawals, taxes) stay float64 to avoid drift over long sums.
+PATH_DTYPE = np.float32
+
+
+def _employment_schedule(
+    years: np.ndarray,
+    income: float,
+    growth_rate: float,
+    current_age: int,
+    retirement_age: int,
 ) -> np.ndarray:
-    """Combine a primary scalar and a spouse value (scalar or array) into a simulation array."""
-    result = np.full(n_sims, primary_value)
-    if isinstance(spouse_value, np.ndarray):
-        result = result + spouse_value
-    elif isinstance(spouse_value, (int, float)) and spouse_value > 0:
-        result = result + spouse_value
-    return result
+    """Employment income by simulation year, growing until retirement."""
+    if income <= 0:
+        return np.zeros(len(years))
+    years_worked = np.minimum(years, retirement_age - current_age)
+    return np.where(
+        current_age + years < retirement_age,
+        income * (1 + growth_rate) ** years_worked,
+        0.0,
+    )
+
+
+def _guaranteed_income_schedule(
+    p: SimulationInput,
+    n_years: int,
+    include_spouse: bool,
+) -> dict[str, np.ndarray]:
+    """
+    Precompute path-independent income for every simulation year.
+
+    Returns:
+        Dict of (n_years,) arrays: 'employment', 'social_security', 'pension',
+        'spouse_employment', 'spouse_ss', 'spouse_pension', 'annuity' (the
+        scheduled payment before mortality), and 'annuity_requires_alive'
+        (bool, whether the annuity only pays while the primary is alive).
+    """
+    years = np.arange(n_years)
+    ages = p.current_age + years
+    zeros = np.zeros(n_years)
+
+    schedule = {
+        "employment": _employment_schedule(
+            years,
+            p.employment_income,
+            p.employment_growth_rate,
+            p.current_age,
+            p.retirement_age,
+        ),
+        "social_security": np.where(
+            ages >= p.social_security_start_age, p.social_security_monthly * 12, 0.0
+        ),
+        "pension": np.full(n_years, p.pension_annual, dtype=float),
+        "spouse_employment": zeros,
+        "spouse_ss": zeros,
+        "spouse_pension": zeros,
+        "annuity": zeros,
+        "annuity_requires_alive": np.zeros(n_years, dtype=bool),
+    }
+
+    if include_spouse:
+        spouse = p.spouse
+        spouse_ages = spouse.age + years
+        schedule["spouse_employment"] = _employment_schedule(
+            years,
+            spouse.employment_income,
+            spouse.employment_growth_rate,
+            spouse.age,
+            spouse.retirement_age,
+        )
+        schedule["spouse_ss"] = np.where(
+            spouse_ages >= spouse.social_security_start_age,
+            spouse.social_security_monthly * 12,
+            0.0,
+        )
+        schedule["spouse_pension"] = np.full(
+            n_years, spouse.pension_annual, dtype=float
+        )
+
+    if p.has_annuity and p.annuity:
+        annual_payment = p.annuity.monthly_payment * 12
+        in_guarantee = years < p.annuity.guarantee_years
+        if p.annuity.annuity_type == "fixed_period":
+            schedule["annuity"] = np.where(in_guarantee, annual_payment, 0.0)
+        elif p.annuity.annuity_type == "life_with_guarantee":
+            # Pays during the guarantee period, then only while primary is alive
+            schedule["annuity"] = np.full(n_years, annual_payment)
+            schedule["annuity_requires_alive"] = ~in_guarantee
+        else:  # life_only
+            schedule["annuity"] = np.full(n_years, annual_payment)
+            schedule["annuity_requires_alive"] = np.ones(n_years, dtype=bool)
+
+    return schedule
+
+
+def _advance_year(
+    new_value: np.ndarray,
+    active: np.ndarray,
+    gross_withdrawal: np.ndarray,
+    estimated_taxes: np.ndarray,
+    next_value: np.ndarray,
+    total_withdrawn: np.ndarray,
+    total_taxes: np.ndarray,
+) -> None:
+    """
+    Apply one year's end-of-year portfolio values to the running path state.
+
+    All state arrays are updated in place with masked ufuncs rather than
+    boolean gathers and scatters, so the only per-year temporary is the
+    positivity mask:
+    - next_value (zero-initialized) receives new_value floored at zero
+    - total_withdrawn/total_taxes accumulate only for active paths, since
+      dead or depleted paths still carry nonzero withdrawals
+    """
+    positive = new_value > 0
+    np.copyto(next_value, new_value, where=positive)
+    np.add(total_withdrawn, gross_withdrawal, out=total_withdrawn, where=active)
+    np.add(total_taxes, estimated_taxes, out=total_taxes, where=active)
+
+
+def _failure_years(paths: np.ndarray, years_run: int) -> np.ndarray:
+    """
+    First year each path is depleted, or n_years + 1 if it never is.
+
+    A path is depleted in the first year its value drops to zero from a
+    positive balance; found with one argmax over the year-major paths once
+    the run is done, rather than with per-year mask bookkeeping. Only the
+    first years_run years are scanned: years skipped after every path died
+    or depleted are left at zero and must not read as depletions.
+    """
+    n_years = paths.shape[0] - 1
+    depleted = paths[1 : years_run + 1] <= 0
+    depleted &= paths[:years_run] > 0
+    return np.where(
+        depleted.any(axis=0), depleted.argmax(axis=0) + 1.0, float(n_years + 1)
+    )
+
+
+def _initial_withdrawal_rate(p: SimulationInput) -> float:
+    """First-year net withdrawal as a percentage of starting capital."""
+    guaranteed_income = (
+        p.social_security_monthly * 12
+        + p.pension_annual
+        + (p.employment_income if p.current_age < p.retirement_age else 0)
+    )
+    if p.has_spouse and p.spouse:
+        guaranteed_income += (
+            p.spouse.social_security_monthly * 12
+            + p.spouse.pension_annual
+            + (
+                p.spouse.employment_income
+                if p.spouse.age < p.spouse.retirement_age
+                else 0
+            )
+        )
+    if p.has_annuity and p.annuity:
+        guaranteed_income += p.annuity.monthly_payment * 12
+
+    initial_net_need = max(0, p.annual_spending - guaranteed_income)
+    return (initial_net_need / p.total_capital * 100) if p.total_capital > 0 else 0
+
+
+@dataclass
+class SimulationPaths:
+    """Per-path outputs of a simulation run, before summarizing.
+
+    Arrays follow the simulator's layouts: ``paths`` and ``yearly`` matrices
+    are year-major (years x sims); the rest are one entry per simulation.
+    """
+
+    paths: np.ndarray
+    failure_year: np.ndarray
+    total_withdrawn: np.ndarray
+    total_taxes: np.ndarray
+    alive_at_end: np.ndarray
+    yearly: dict[str, np.ndarray]
+
+    @classmethod
+    def concatenate(cls, chunks: list["SimulationPaths"]) -> "SimulationPaths":
+        """Join chunks run over disjoint sets of simulations."""
+        return cls(
+            paths=np.concatenate([c.paths for c in chunks], axis=1),
+            failure_year=np.concatenate([c.failure_year for c in chunks]),
+            total_withdrawn=np.concatenate([c.total_withdrawn for c in chunks]),
+            total_taxes=np.concatenate([c.total_taxes for c in chunks]),
+            alive_at_end=np.concatenate([c.alive_at_end for c in chunks]),
+            yearly={
+                name: np.concatenate([c.yearly[name] for c in chunks], axis=1)
+                for name in chunks[0].yearly
+            },
+        )
+
+
+def _run_chunk(params: SimulationInput, rng: np.random.Generator) -> SimulationPaths:
+    """Simulate one shard of paths in a worker process.
+
+    Module-level so it can be pickled by multiprocessing.
+    """
+    events = MonteCarloSimulator(params, seed=rng)._simulate_paths()
+    while True:
+        try:
+            next(events)
+        except StopIteration as done:
+            return done.value
 
 
 class MonteCarloSimulator:
@@ -40,12 +239,27 @@ class MonteCarloSimulator:
     - Multiple income sources (employment, SS, pension, annuity)
     """
 
-    def __init__(self, params: SimulationInput):
-        """Initialize simulator with input parameters."""
+    def __init__(
+        self,
+        params: SimulationInput,
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None,
+    ):
+        """Initialize simulator with input parameters and an optional RNG seed."""
         self.params = params
-        self._rng = np.random.default_rng()
+        # SFC64 is the cheapest of NumPy's bit generators and still passes
+        # BigCrush; draws are a large share of the non-tax run time.
+        if isinstance(seed, np.random.Generator):
+            self._rng = seed
+        else:
+            self._rng = np.random.default_rng(np.random.SFC64(seed))
         self.tax_calc = TaxCalculator(state=params.state)
 
+        # Result of the last completed run, keyed by the params it was run with.
+        # The tracker's balances are consumed by a run, so repeat calls to
+        # run()/run_with_progress() must replay the cached result.
+        self._result: SimulationResult | None = None
+        self._cache_key: str | None = None
+
         # Create holdings tracker if holdings are provided
         n_years = params.max_age - params.current_age
         self.tracker = create_holdings_tracker(
@@ -65,28 +279,61 @@ class MonteCarloSimulator:
         """
         p = self.params
         n_years = p.max_age - p.current_age
+
+        cache_key = p.model_dump_json()
+        if self._result is not None and self._cache_key == cache_key:
+            yield ("progress", n_years, n_years)
+            yield ("result", self._result)
+            return
+
+        sim_paths = yield from self._simulate_paths()
+        result = self._summarize(sim_paths)
+
+        self._result = result
+        self._cache_key = cache_key
+
+        # Yield final result
+        yield ("result", result)
+
+    def _simulate_paths(self):
+        """
+        Simulate every path year by year.
+
+        Yields:
+            ("progress", year, total_years) tuples during simulation.
+
+        Returns:
+            SimulationPaths with the per-path arrays.
+        """
+        p = self.params
+        n_years = p.max_age - p.current_age
         n_sims = p.n_simulations
 
         annual_spending = p.annual_spending
 
-        # Initialize paths
-        paths = np.zeros((n_sims, n_years + 1))
+        # Initialize paths, stored year-major: paths[year] is contiguous
+        paths = np.zeros((n_years + 1, n_sims), dtype=PATH_DTYPE)
         if self.tracker:
             # Use tracker for holdings-based portfolio
-            paths[:, 0] = self.tracker.total_balance
+            paths[0] = self.tracker.total_balance
         else:
             # Legacy mode: single total_capital
-            paths[:, 0] = p.total_capital
+            paths[0] = p.total_capital
 
         # Track withdrawals and taxes
         total_withdrawn = np.zeros(n_sims)
         total_taxes = np.zeros(n_sims)
-        failure_year = np.full(n_sims, n_years + 1, dtype=float)
 
         # Generate market returns using selected model and allocation
         # Only needed if NOT using tracker (tracker has its own returns)
         if not self.tracker:
-            price_growth, div_yields = generate_blended_returns(
+            # Year-major buffers, filled through transposed views so each
+            # year's returns are contiguous. Price returns are turned into
+            # growth factors (1 + r) so each year's portfolio update is one
+            # multiply and one subtract.
+            growth_factors = np.empty((n_years, n_sims), dtype=PATH_DTYPE)
+            div_yields = np.empty((n_years, n_sims), dtype=PATH_DTYPE)
+            generate_blended_returns(
                 n_simulations=n_sims,
                 n_years=n_years,
                 stock_allocation=p.stock_allocation,
@@ -96,8 +343,16 @@ class MonteCarloSimulator:
                 stock_index=p.stock_index,
                 bond_index=p.bond_index,
                 rng=self._rng,
+                out_price=growth_factors.T,
+                out_div=div_yields.T,
             )
-        # Generate mortality masks
+            growth_factors += 1
+            # Per-year scratch buffers, reused rather than reallocated
+            dividends_buf = np.empty(n_sims, dtype=PATH_DTYPE)
+            new_value_buf = np.empty(n_sims, dtype=PATH_DTYPE)
+            no_roth_dividends = np.zeros(n_sims, dtype=PATH_DTYPE)
+
+        # Generate mortality masks (year-major: alive[year] is contiguous)
         if p.include_mortality:
             if p.has_spouse and p.spouse:
                 primary_alive, spouse_alive, either_alive = generate_joint_alive_mask(
@@ -116,119 +371,63 @@ class MonteCarloSimulator:
                 primary_alive = either_alive
                 spouse_alive = None
         else:
-            either_alive = np.ones((n_sims, n_years + 1), dtype=bool)
+            either_alive = np.ones((n_years + 1, n_sims), dtype=bool)
             primary_alive = either_alive
             spouse_alive = None
 
-        # Calculate initial withdrawal rate for reporting
-        guaranteed_income = (
-            p.social_security_monthly * 12
-            + p.pension_annual
-            + (p.employment_income if p.current_age < p.retirement_age else 0)
-        )
-        if p.has_spouse and p.spouse:
-            guaranteed_income += (
-                p.spouse.social_security_monthly * 12
-                + p.spouse.pension_annual
-                + (
-                    p.spouse.employment_income
-                    if p.spouse.age < p.spouse.retirement_age
-                    else 0
-                )
-            )
-        if p.has_annuity and p.annuity:
-            guaranteed_income += p.annuity.monthly_payment * 12
-
-        initial_net_need = max(0, annual_spending - guaranteed_income)
-        initial_withdrawal_rate = (
-            (initial_net_need / p.total_capital * 100) if p.total_capital > 0 else 0
-        )
-
         # Yield initial progress
         yield ("progress", 0, n_years)
 
-        # Track year-by-year data for detailed breakdown
-        yearly_employment = np.zeros((n_sims, n_years))
-        yearly_ss = np.zeros((n_sims, n_years))
-        yearly_pension = np.zeros((n_sims, n_years))
-        yearly_dividends = np.zeros((n_sims, n_years))
-        yearly_annuity = np.zeros((n_sims, n_years))
-        yearly_withdrawal = np.zeros((n_sims, n_years))
-        yearly_federal_tax = np.zeros((n_sims, n_years))
-        yearly_state_tax = np.zeros((n_sims, n_years))
-        yearly_total_tax = np.zeros((n_sims, n_years))
+        # Track year-by-year data for detailed breakdown (year-major, like paths)
+        yearly_employment = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_ss = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_pension = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_dividends = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_annuity = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_withdrawal = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_federal_tax = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_state_tax = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+        yearly_total_tax = np.zeros((n_years, n_sims), dtype=PATH_DTYPE)
+
+        # Deterministic income schedule, hoisted out of the year loop
+        include_spouse = bool(p.has_spouse and p.spouse and spouse_alive is not None)
+        income = _guaranteed_income_schedule(p, n_years, include_spouse)
 
         # Process year by year
+        years_run = n_years
         for year in range(n_years):
             current_age = p.current_age + year
-            current_value = paths[:, year]
+            current_value = paths[year]
 
-            # Skip dead or depleted paths
-            active = (current_value > 0) & either_alive[:, year]
+            # Skip dead or depleted paths. Neither state is ever left, so once
+            # no path is active the remaining years (already zero) are done.
+            active = (current_value > 0) & either_alive[year]
             if not np.any(active):
-                yield ("progress", year + 1, n_years)
-                continue
-
-            # Calculate income for this year
-            # Primary person
-            employment = 0.0
-            if p.employment_income > 0 and current_age < p.retirement_age:
-                years_worked = min(year, p.retirement_age - p.current_age)
-                employment = p.employment_income * (
-                    (1 + p.employment_growth_rate) ** years_worked
-                )
-
-            ss_start_age = getattr(p, "social_security_start_age", 67)
-            social_security = (
-                p.social_security_monthly * 12 if current_age >= ss_start_age else 0
-            )
-            pension = p.pension_annual
-
-            # Spouse income
-            spouse_employment = 0.0
-            spouse_ss = 0.0
-            spouse_pension = 0.0
-            if p.has_spouse and p.spouse and spouse_alive is not None:
-                spouse_current_age = p.spouse.age + year
-                if (
-                    p.spouse.employment_income > 0
-                    and spouse_current_age < p.spouse.retirement_age
-                ):
-                    years_worked = min(year, p.spouse.retirement_age - p.spouse.age)
-                    spouse_employment = p.spouse.employment_income * (
-                        (1 + p.spouse.employment_growth_rate) ** years_worked
-                    )
-                spouse_ss_start = getattr(p.spouse, "social_security_start_age", 67)
-                if spouse_current_age >= spouse_ss_start:
-                    spouse_ss = p.spouse.social_security_monthly * 12
-                spouse_pension = p.spouse.pension_annual
-
-                # Zero out spouse income if spouse is dead
-                spouse_dead = ~spouse_alive[:, year]
-                if np.any(spouse_dead):
-                    # These are arrays
-                    spouse_employment = np.where(spouse_dead, 0, spouse_employment)
-                    spouse_ss = np.where(spouse_dead, 0, spouse_ss)
-                    spouse_pension = np.where(spouse_dead, 0, spouse_pension)
-
-            # Annuity income
-            annuity_income = 0.0
-            if p.has_annuity and p.annuity:
-                if p.annuity.annuity_type == "fixed_period":
-                    if year < p.annuity.guarantee_years:
-                        annuity_income = p.annuity.monthly_payment * 12
-                elif p.annuity.annuity_type == "life_with_guarantee":
-                    # Pay if within guarantee period OR primary is alive
-                    annuity_income = p.annuity.monthly_payment * 12
-                    if year >= p.annuity.guarantee_years:
-                        # Only pay if primary alive after guarantee
-                        annuity_income = np.where(
-                            primary_alive[:, year], annuity_income, 0
-                        )
-                else:  # life_only
-                    annuity_income = np.where(
-                        primary_alive[:, year], p.annuity.monthly_payment * 12, 0
-                    )
+                yield ("progress", n_years, n_years)
+                years_run = year
+                break
+
+            # Guaranteed income for this year (precomputed schedule)
+            employment = income["employment"][year]
+            social_security = income["social_security"][year]
+            pension = income["pension"][year]
+            spouse_employment = income["spouse_employment"][year]
+            spouse_ss = income["spouse_ss"][year]
+            spouse_pension = income["spouse_pension"][year]
+
+            # Zero out spouse income if spouse is dead (scalar * bool mask).
+            # While the spouse is alive on every path, incomes stay scalars.
+            if include_spouse:
+                spouse_alive_now = spouse_alive[year]
+                if not spouse_alive_now.all():
+                    spouse_employment = spouse_employment * spouse_alive_now
+                    spouse_ss = spouse_ss * spouse_alive_now
+                    spouse_pension = spouse_pension * spouse_alive_now
+
+            # Annuity income, conditional on primary survival where required
+            annuity_income = income["annuity"][year]
+            if income["annuity_requires_alive"][year]:
+                annuity_income = annuity_income * primary_alive[year]
 
             # Portfolio dividend income
             if self.tracker:
@@ -240,8 +439,10 @@ class MonteCarloSimulator:
                 roth_dividends = div_by_account["roth"]
             else:
                 # Legacy mode: use blended returns
-                dividends = current_value * div_yields[:, year]
-                roth_dividends = np.zeros(n_sims)
+                dividends = np.multiply(
+                    current_value, div_yields[year], out=dividends_buf
+                )
+                roth_dividends = no_roth_dividends
 
             # Total guaranteed income (not including dividends)
             total_guaranteed = (
@@ -254,23 +455,21 @@ class MonteCarloSimulator:
                 + annuity_income
             )
 
-            # Make sure total_guaranteed is broadcastable
-            if isinstance(total_guaranteed, (int, float)):
-                total_guaranteed = np.full(n_sims, total_guaranteed)
-
             # Total income including dividends reduces withdrawal needs
-            # Roth dividends also reduce withdrawal needs (tax-free)
+            # Roth dividends also reduce withdrawal needs (tax-free). Dividends
+            # are (n_sims,) arrays in both modes, so from here on every
+            # per-path quantity is an array; guaranteed income may be scalar.
             total_income_for_spending = total_guaranteed + dividends + roth_dividends
 
             # Net withdrawal needed from portfolio (after all income including dividends)
             net_need = annual_spending - total_income_for_spending
-            net_need = np.maximum(0, net_need)
+            np.maximum(net_need, 0, out=net_need)
 
-            # Build combined income arrays (shared by both tracker and legacy modes)
-            ss_income = _combine_primary_and_spouse(n_sims, social_security, spouse_ss)
-            employment_total = _combine_primary_and_spouse(
-                n_sims, employment, spouse_employment
-            )
+            # Combined household income (shared by both tracker and legacy
+            # modes). These stay scalars unless spouse mortality varies by path;
+            # the tax calculator broadcasts scalars across the batch.
+            ss_income = social_security + spouse_ss
+            employment_total = employment + spouse_employment
 
             # Handle withdrawals and taxes
             if self.tracker:
@@ -284,20 +483,21 @@ class MonteCarloSimulator:
                 )
                 ordinary_income = employment_total + trad_withdrawals
 
-                tax_results = self.tax_calc.calculate_batch_taxes(
-                    capital_gains_array=np.asarray(
-                        withdrawal_result["taxable"]
-                    ).flatten(),
-                    social_security_array=np.asarray(ss_income).flatten(),
-                    ages=np.full(n_sims, current_age),
+                tax_results = self.tax_calc.calculate_unique_taxes(
+                    capital_gains_array=withdrawal_result["taxable"],
+                    social_security_array=ss_income,
+                    ages=current_age,
                     filing_status=p.filing_status,
-                    dividend_income_array=np.asarray(dividends).flatten(),
-                    employment_income_array=np.asarray(ordinary_income).flatten(),
+                    dividend_income_array=dividends,
+                    employment_income_array=ordinary_income,
                     year=START_YEAR + year,
+                    active=active,
                 )
 
-                estimated_taxes = np.asarray(tax_results["total_tax"]).flatten()
-                estimated_taxes = np.maximum(0, estimated_taxes)
+                # Clip in place: the result arrays are fresh per call
+                estimated_taxes = np.maximum(
+                    tax_results["total_tax"], 0, out=tax_results["total_tax"]
+                )
 
                 gross_withdrawal = withdrawal_result["total"] + estimated_taxes
 
@@ -307,93 +507,102 @@ class MonteCarloSimulator:
 
             else:
                 # Legacy mode: simplified tax treatment (all withdrawals as capital gains)
-                tax_results = self.tax_calc.calculate_batch_taxes(
-                    capital_gains_array=np.asarray(net_need).flatten(),
-                    social_security_array=np.asarray(ss_income).flatten(),
-                    ages=np.full(n_sims, current_age),
+                tax_results = self.tax_calc.calculate_unique_taxes(
+                    capital_gains_array=net_need,
+                    social_security_array=ss_income,
+                    ages=current_age,
                     filing_status=p.filing_status,
-                    dividend_income_array=np.asarray(dividends).flatten(),
-                    employment_income_array=np.asarray(employment_total).flatten(),
+                    dividend_income_array=dividends,
+                    employment_income_array=employment_total,
                     year=START_YEAR + year,
+                    active=active,
+                )
+                estimated_taxes = np.maximum(
+                    tax_results["total_tax"], 0, out=tax_results["total_tax"]
                 )
-                estimated_taxes = np.asarray(tax_results["total_tax"]).flatten()
-                estimated_taxes = np.maximum(0, estimated_taxes)
 
-                net_need = np.asarray(net_need).flatten()
-                dividends = np.asarray(dividends).flatten()
                 gross_withdrawal = net_need + estimated_taxes
 
                 # Portfolio dynamics - price returns only, dividends are income not growth
-                growth = current_value * price_growth[:, year]
-                new_value = current_value + growth - gross_withdrawal
-
-            # Track depletion
-            depleted = (current_value > 0) & (new_value <= 0)
-            depleted_mask = depleted & (failure_year > year)
-            failure_year[depleted_mask] = year + 1
-
-            # Update paths
-            paths[:, year + 1] = np.maximum(0, new_value)
-            total_withdrawn[active] += gross_withdrawal[active]
-            total_taxes[active] += estimated_taxes[active]
+                new_value = np.multiply(
+                    current_value, growth_factors[year], out=new_value_buf
+                )
+                new_value -= gross_withdrawal
+
+            _advance_year(
+                new_value=new_value,
+                active=active,
+                gross_withdrawal=gross_withdrawal,
+                estimated_taxes=estimated_taxes,
+                next_value=paths[year + 1],
+                total_withdrawn=total_withdrawn,
+                total_taxes=total_taxes,
+            )
 
             # Store yearly breakdown data
-            yearly_employment[:, year] = (
-                np.broadcast_to(employment_total, n_sims)
-                if isinstance(employment_total, np.ndarray)
-                else employment_total
-            )
-            yearly_ss[:, year] = (
-                np.broadcast_to(ss_income, n_sims)
-                if isinstance(ss_income, np.ndarray)
-                else ss_income
-            )
-            yearly_pension[:, year] = pension + (
-                spouse_pension
-                if isinstance(spouse_pension, (int, float))
-                else np.median(spouse_pension)
-            )
-            yearly_dividends[:, year] = dividends
-            yearly_annuity[:, year] = (
-                np.broadcast_to(annuity_income, n_sims)
-                if isinstance(annuity_income, np.ndarray)
-                else annuity_income
-            )
-            yearly_withdrawal[:, year] = gross_withdrawal
-            yearly_federal_tax[:, year] = np.asarray(
-                tax_results["federal_income_tax"]
-            ).flatten()
-            yearly_state_tax[:, year] = np.asarray(
-                tax_results["state_income_tax"]
-            ).flatten()
-            yearly_total_tax[:, year] = estimated_taxes
+            yearly_employment[year] = employment_total
+            yearly_ss[year] = ss_income
+            yearly_pension[year] = pension + np.median(spouse_pension)
+            yearly_dividends[year] = dividends
+            yearly_annuity[year] = annuity_income
+            yearly_withdrawal[year] = gross_withdrawal
+            yearly_federal_tax[year] = tax_results["federal_income_tax"]
+            yearly_state_tax[year] = tax_results["state_income_tax"]
+            yearly_total_tax[year] = estimated_taxes
 
             # Yield progress after each year
             yield ("progress", year + 1, n_years)
 
+        return SimulationPaths(
+            paths=paths,
+            failure_year=_failure_years(paths, years_run),
+            total_withdrawn=total_withdrawn,
+            total_taxes=total_taxes,
+            alive_at_end=either_alive[-1],
+            yearly={
+                "employment": yearly_employment,
+                "social_security": yearly_ss,
+                "pension": yearly_pension,
+                "dividends": yearly_dividends,
+                "annuity": yearly_annuity,
+                "withdrawal": yearly_withdrawal,
+                "federal_tax": yearly_federal_tax,
+                "state_tax": yearly_state_tax,
+                "total_tax": yearly_total_tax,
+            },
+        )
+
+    def _summarize(self, sim_paths: SimulationPaths) -> SimulationResult:
+        """Reduce per-path arrays to the reported statistics."""
+        p = self.params
+        n_years = p.max_age - p.current_age
+        paths = sim_paths.paths
+        failure_year = sim_paths.failure_year
+        total_withdrawn = sim_paths.total_withdrawn
+        total_taxes = sim_paths.total_taxes
+        yearly = sim_paths.yearly
+
         # Store per-path arrays for downstream use (e.g., annuity comparison)
         self._total_withdrawn = total_withdrawn
         self._total_taxes = total_taxes
 
         # Calculate results
-        final_values = paths[:, -1]
+        final_values = paths[-1]
 
         # Success = either alive at end with money, or died before running out
         if p.include_mortality:
-            success_mask = (failure_year > n_years) | (~either_alive[:, -1])
+            success_mask = (failure_year > n_years) | (~sim_paths.alive_at_end)
         else:
             success_mask = failure_year > n_years
 
         success_rate = float(np.mean(success_mask))
 
         # Percentile paths for charting (sampled at yearly intervals)
-        percentile_paths = {
-            "p5": [float(np.percentile(paths[:, i], 5)) for i in range(n_years + 1)],
-            "p25": [float(np.percentile(paths[:, i], 25)) for i in range(n_years + 1)],
-            "p50": [float(np.percentile(paths[:, i], 50)) for i in range(n_years + 1)],
-            "p75": [float(np.percentile(paths[:, i], 75)) for i in range(n_years + 1)],
-            "p95": [float(np.percentile(paths[:, i], 95)) for i in range(n_years + 1)],
-        }
+        # One call covers every year; the final year doubles as the
+        # final-value percentiles
+        path_percentiles = np.percentile(paths, PERCENTILES, axis=1).tolist()
+        percentile_paths = dict(zip(PERCENTILE_KEYS, path_percentiles, strict=True))
+        final_percentiles = {key: path[-1] for key, path in percentile_paths.items()}
 
         # Median depletion age
         depleted_sims = failure_year[failure_year <= n_years]
@@ -406,23 +615,29 @@ class MonteCarloSimulator:
         # 10-year failure probability
         prob_10_year_failure = float(np.mean(failure_year <= 10))
 
-        # Build year-by-year breakdown for median scenario
+        # Build year-by-year breakdown for median scenario. Medians for every
+        # year come from one np.median call per quantity; portfolio medians
+        # reuse the p50 path.
+        median_path = percentile_paths["p50"]
+        medians = {
+            name: np.median(values, axis=1).tolist() for name, values in yearly.items()
+        }
         year_breakdown = []
         for year in range(n_years):
             current_age = p.current_age + year
-            portfolio_start = float(np.median(paths[:, year]))
-            portfolio_end = float(np.median(paths[:, year + 1]))
+            portfolio_start = median_path[year]
+            portfolio_end = median_path[year + 1]
 
             # Get median values for this year
-            employment = float(np.median(yearly_employment[:, year]))
-            ss = float(np.median(yearly_ss[:, year]))
-            pension_val = float(np.median(yearly_pension[:, year]))
-            divs = float(np.median(yearly_dividends[:, year]))
-            annuity_val = float(np.median(yearly_annuity[:, year]))
-            withdrawal = float(np.median(yearly_withdrawal[:, year]))
-            fed_tax = float(np.median(yearly_federal_tax[:, year]))
-            state_tax = float(np.median(yearly_state_tax[:, year]))
-            total_tax = float(np.median(yearly_total_tax[:, year]))
+            employment = medians["employment"][year]
+            ss = medians["social_security"][year]
+            pension_val = medians["pension"][year]
+            divs = medians["dividends"][year]
+            annuity_val = medians["annuity"][year]
+            withdrawal = medians["withdrawal"][year]
+            fed_tax = medians["federal_tax"][year]
+            state_tax = medians["state_tax"][year]
+            total_tax = medians["total_tax"][year]
 
             total_income = employment + ss + pension_val + divs + annuity_val
             net_income = total_income + withdrawal - total_tax
@@ -457,15 +672,9 @@ class MonteCarloSimulator:
 
         result = SimulationResult(
             success_rate=success_rate,
-            median_final_value=float(np.median(final_values)),
+            median_final_value=final_percentiles["p50"],
             mean_final_value=float(np.mean(final_values)),
-            percentiles={
-                "p5": float(np.percentile(final_values, 5)),
-                "p25": float(np.percentile(final_values, 25)),
-                "p50": float(np.percentile(final_values, 50)),
-                "p75": float(np.percentile(final_values, 75)),
-                "p95": float(np.percentile(final_values, 95)),
-            },
+            percentiles=final_percentiles,
             median_depletion_age=median_depletion_age,
             median_depletion_year=(
                 float(np.median(depleted_sims)) if len(depleted_sims) > 0 else None
@@ -474,12 +683,11 @@ class MonteCarloSimulator:
             total_taxes_median=float(np.median(total_taxes)),
             percentile_paths=percentile_paths,
             year_breakdown=year_breakdown,
-            initial_withdrawal_rate=initial_withdrawal_rate,
+            initial_withdrawal_rate=_initial_withdrawal_rate(p),
             prob_10_year_failure=prob_10_year_failure,
         )
 
-        # Yield final result
-        yield ("result", result)
+        return result
 
     def run_with_progress(self):
         """
@@ -495,14 +703,51 @@ class MonteCarloSimulator:
             elif event[0] == "result":
                 yield {"type": "complete", "result": event[1].model_dump()}
 
-    def run(self) -> SimulationResult:
-        """Run the Monte Carlo simulation."""
+    def run(self, n_workers: int | None = 1) -> SimulationResult:
+        """
+        Run the Monte Carlo simulation.
+
+        Args:
+            n_workers: Worker processes to shard simulations across. Paths are
+                independent, so chunks run in parallel and are concatenated
+                before summarizing. None uses every CPU; 1 runs in-process.
+        """
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers > 1:
+            return self._run_parallel(n_workers)
+
         for event in self._simulate_core():
             if event[0] == "result":
                 return event[1]
         # Should never reach here, but satisfy type checker
         raise RuntimeError("Simulation did not produce a result")
 
+    def _run_parallel(self, n_workers: int) -> SimulationResult:
+        """Run simulation chunks in a process pool and summarize them together."""
+        p = self.params
+        cache_key = p.model_dump_json()
+        if self._result is not None and self._cache_key == cache_key:
+            return self._result
+
+        # Each chunk draws from an independent child stream of this RNG
+        n_workers = min(n_workers, p.n_simulations)
+        chunk_sizes = [
+            len(chunk)
+            for chunk in np.array_split(np.arange(p.n_simulations), n_workers)
+        ]
+        tasks = [
+            (p.model_copy(update={"n_simulations": size}), rng)
+            for size, rng in zip(chunk_sizes, self._rng.spawn(n_workers), strict=True)
+        ]
+        with Pool(n_workers) as pool:
+            chunks = pool.starmap(_run_chunk, tasks)
+
+        result = self._summarize(SimulationPaths.concatenate(chunks))
+        self._result = result
+        self._cache_key = cache_key
+        return result
+
 
 def compare_to_annuity(
     simulation_result: SimulationResult,
@@ -529,8 +774,8 @@ def compare_to_annuity(
 
     # Compute real probability from path-level data
     if total_withdrawn is not None and total_taxes is not None:
-        net_income_per_path = total_withdrawn - total_taxes
-        prob_beats = float(np.mean(net_income_per_path > annuity_total))
+        beats = np.count_nonzero((total_withdrawn - total_taxes) > annuity_total)
+        prob_beats = beats / total_withdrawn.size
     else:
         # Fallback: simple estimate from median
         prob_beats = float(sim_total > annuity_total) * 0.5 + 0.25
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .config import get_settings
@@ -20,6 +26,9 @@ if TYPE_CHECKING:
     from supabase import Client
 
 
+# Clients are created once per process and shared, so requests reuse their
+# pooled keep-alive connections instead of opening new ones each time
+@lru_cache
 def get_supabase_client() -> Client | None:
     """Get Supabase client instance (returns None if not configured)."""
     if not HAS_SUPABASE:
@@ -30,6 +39,7 @@ def get_supabase_client() -> Client | None:
     return create_client(settings.supabase_url, settings.supabase_anon_key)
 
 
+@lru_cache
 def get_supabase_admin_client() -> Client | None:
     """Get Supabase admin client with service key."""
     if not HAS_SUPABASE:
@@ -40,23 +50,57 @@ def get_supabase_admin_client() -> Client | None:
     return create_client(settings.supabase_url, settings.supabase_service_key)
 
 
+# Verified users keyed by a hash of their token, so a client sending the same
+# token on every request skips the round trip to Supabase. Entries live for
+# JWT_CACHE_TTL seconds or until the token expires, whichever is sooner;
+# failed verifications are never cached.
+JWT_CACHE_TTL = 300
+JWT_CACHE_SIZE = 1024
+_jwt_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+
+def _token_ttl(token: str) -> float:
+    """Seconds to cache a verified token: JWT_CACHE_TTL, capped at its exp."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * -len(payload)))
+        return min(JWT_CACHE_TTL, float(claims["exp"]) - time.time())
+    except Exception:
+        return JWT_CACHE_TTL
+
+
 async def verify_jwt(token: str) -> dict | None:
     """
     Verify a Supabase JWT token.
 
     Returns user data if valid, None otherwise.
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        expires_at, user = cached
+        if time.monotonic() < expires_at:
+            _jwt_cache.move_to_end(key)
+            return user
+        del _jwt_cache[key]
+
     client = get_supabase_client()
     if not client:
         return None
     try:
         response = client.auth.get_user(token)
         if response and response.user:
-            return {
+            user = {
                 "id": response.user.id,
                 "email": response.user.email,
                 "created_at": str(response.user.created_at),
             }
+            ttl = _token_ttl(token)
+            if ttl > 0:
+                _jwt_cache[key] = (time.monotonic() + ttl, user)
+                if len(_jwt_cache) > JWT_CACHE_SIZE:
+                    _jwt_cache.popitem(last=False)
+            return user
     except Exception:
         pass
     return None
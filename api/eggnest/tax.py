@@ -1,21 +1,123 @@
 """Tax calculations using PolicyEngine-US."""
 
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
 from policyengine_core.data import Dataset
 from policyengine_us import Microsimulation
 
-from eggnest.constants import FILING_STATUS_PE_DATASET, STATE_FIPS
+from eggnest.constants import (
+    FILING_STATUS_PE_DATASET,
+    NO_INCOME_TAX_STATES,
+    STATE_FIPS,
+)
+
+# PolicyEngine input variables and the _scenario_inputs column each is set
+# from. Entity ids, weights and the zero interest column depend only on the
+# batch size, so a reused simulation keeps them and resets SCENARIO_FIELDS.
+STRUCTURE_FIELDS = (
+    ("person_id", "ids"),
+    ("person_household_id", "ids"),
+    ("person_tax_unit_id", "ids"),
+    ("person_family_id", "ids"),
+    ("person_spm_unit_id", "ids"),
+    ("person_marital_unit_id", "ids"),
+    ("person_weight", "weights"),
+    ("household_id", "ids"),
+    ("household_weight", "weights"),
+    ("tax_unit_id", "ids"),
+    ("tax_unit_weight", "weights"),
+    ("family_id", "ids"),
+    ("family_weight", "weights"),
+    ("spm_unit_id", "ids"),
+    ("spm_unit_weight", "weights"),
+    ("marital_unit_id", "ids"),
+    ("marital_unit_weight", "weights"),
+    ("interest_income", "zeros"),
+)
+SCENARIO_FIELDS = (
+    ("age", "ages"),
+    ("long_term_capital_gains", "capital_gains"),
+    ("social_security", "social_security"),
+    ("social_security_retirement", "social_security"),
+    ("employment_income", "employment_income"),
+    ("dividend_income", "dividend_income"),
+    ("state_fips", "state_fips"),
+    ("filing_status", "filing_status"),
+)
+
+
+def _scenario_inputs(
+    n_scenarios: int,
+    capital_gains_array: np.ndarray,
+    social_security_array: np.ndarray,
+    ages: np.ndarray,
+    state: str,
+    year: int,
+    filing_status: str,
+    dividend_income_array: np.ndarray,
+    employment_income_array: np.ndarray,
+    fields: tuple[tuple[str, str], ...] = STRUCTURE_FIELDS + SCENARIO_FIELDS,
+) -> dict[str, dict[int, np.ndarray]]:
+    """
+    Build PolicyEngine input arrays, one single-person household per scenario.
+
+    Every entity uses the same id array, and every weight the same ones
+    array; constant columns are broadcast views rather than copies.
+    Generated columns use PolicyEngine's storage dtypes (int32, float32) so
+    they aren't cast on the way in.
+
+    Args:
+        fields: (variable, column) pairs to include; defaults to all inputs.
+    """
+    columns = {
+        "ages": ages,
+        "capital_gains": capital_gains_array,
+        "social_security": social_security_array,
+        "employment_income": employment_income_array,
+        "dividend_income": dividend_income_array,
+        "filing_status": np.broadcast_to(
+            np.int32(FILING_STATUS_PE_DATASET.get(filing_status, 1)), n_scenarios
+        ),
+        "state_fips": np.broadcast_to(np.int32(STATE_FIPS.get(state, 6)), n_scenarios),
+    }
+    if fields is not SCENARIO_FIELDS:
+        columns["ids"] = np.arange(n_scenarios, dtype=np.int32)
+        columns["weights"] = np.ones(n_scenarios, dtype=np.float32)
+        columns["zeros"] = np.zeros(n_scenarios, dtype=np.float32)
+
+    return {variable: {year: columns[column]} for variable, column in fields}
+
+
+def _padded_batch_size(n_scenarios: int) -> int:
+    """
+    Round a batch size up to a reusable bucket.
+
+    Small batches round to a power of two; larger ones to eighth-octave
+    steps, so padding costs at most 12.5% extra rows.
+    """
+    if n_scenarios <= 64:
+        return 1 << max(n_scenarios - 1, 0).bit_length()
+    step = 1 << (n_scenarios.bit_length() - 4)
+    return -(-n_scenarios // step) * step
 
 
 class MonteCarloDataset(Dataset):
-    """Custom dataset for Monte Carlo simulations."""
+    """
+    Custom dataset for Monte Carlo simulations.
+
+    Arrays are kept in memory and served directly to Microsimulation, rather
+    than round-tripping through an HDF5 file.
+    """
 
     name = "monte_carlo_dataset"
     label = "Monte Carlo simulation dataset"
     data_format = Dataset.TIME_PERIOD_ARRAYS
+    # Required by Dataset but never read or written (see load)
+    file_path = Path(tempfile.gettempdir()) / "monte_carlo_dataset.h5"
 
     def __init__(
         self,
@@ -47,71 +149,82 @@ class MonteCarloDataset(Dataset):
             else np.zeros(n_scenarios)
         )
 
-        self.tmp_file = tempfile.NamedTemporaryFile(suffix=".h5", delete=False)
-        self.file_path = Path(self.tmp_file.name)
+        self._data: dict[str, dict[int, np.ndarray]] | None = None
 
         super().__init__()
 
     def generate(self) -> None:
         """Generate the dataset with all Monte Carlo scenarios."""
-        person_ids = np.arange(self.n_scenarios)
-        household_ids = np.arange(self.n_scenarios)
-        tax_unit_ids = np.arange(self.n_scenarios)
-        family_ids = np.arange(self.n_scenarios)
-        spm_unit_ids = np.arange(self.n_scenarios)
-        marital_unit_ids = np.arange(self.n_scenarios)
+        data = _scenario_inputs(
+            n_scenarios=self.n_scenarios,
+            capital_gains_array=self.capital_gains,
+            social_security_array=self.social_security,
+            ages=self.ages,
+            state=self.state,
+            year=self.year,
+            filing_status=self.filing_status,
+            dividend_income_array=self.dividend_income,
+            employment_income_array=self.employment_income,
+        )
+        self.save_dataset(data)
 
-        weights = np.ones(self.n_scenarios)
+    def save_dataset(self, data: dict, file_path: str | None = None) -> None:
+        """Keep the generated arrays in memory."""
+        self._data = data
 
-        filing_status_values = np.full(
-            self.n_scenarios, FILING_STATUS_PE_DATASET.get(self.filing_status, 1)
-        )
+    def load(self, key: str | None = None, mode: str = "r") -> dict | np.ndarray:
+        """Return the in-memory arrays, generating them on first use."""
+        if self._data is None:
+            self.generate()
+        return self._data if key is None else self._data[key]
 
-        state_code = STATE_FIPS.get(self.state, 6)
-
-        data = {
-            "person_id": {self.year: person_ids},
-            "person_household_id": {self.year: household_ids},
-            "person_tax_unit_id": {self.year: tax_unit_ids},
-            "person_family_id": {self.year: family_ids},
-            "person_spm_unit_id": {self.year: spm_unit_ids},
-            "person_marital_unit_id": {self.year: marital_unit_ids},
-            "person_weight": {self.year: weights},
-            "age": {self.year: self.ages},
-            "long_term_capital_gains": {self.year: self.capital_gains},
-            "social_security": {self.year: self.social_security},
-            "social_security_retirement": {self.year: self.social_security},
-            "employment_income": {self.year: self.employment_income},
-            "interest_income": {self.year: np.zeros(self.n_scenarios)},
-            "dividend_income": {self.year: self.dividend_income},
-            "household_id": {self.year: household_ids},
-            "household_weight": {self.year: weights},
-            "household_state_fips": {self.year: np.full(self.n_scenarios, state_code)},
-            "tax_unit_id": {self.year: tax_unit_ids},
-            "tax_unit_weight": {self.year: weights},
-            "filing_status": {self.year: filing_status_values},
-            "family_id": {self.year: family_ids},
-            "family_weight": {self.year: weights},
-            "spm_unit_id": {self.year: spm_unit_ids},
-            "spm_unit_weight": {self.year: weights},
-            "marital_unit_id": {self.year: marital_unit_ids},
-            "marital_unit_weight": {self.year: weights},
-        }
+    def load_dataset(self) -> dict:
+        """Return the complete in-memory dataset."""
+        return self.load()
 
-        self.save_dataset(data)
 
-    def cleanup(self) -> None:
-        """Clean up temporary file."""
-        if hasattr(self, "tmp_file"):
-            try:
-                self.file_path.unlink()
-            except Exception:
-                pass
+def _as_scenario_array(values: np.ndarray | float, n_scenarios: int) -> np.ndarray:
+    """Expand a scalar (or length-1) input to one value per scenario."""
+    return np.array(np.broadcast_to(values, n_scenarios))
 
 
 class TaxCalculator:
     """Calculate taxes using PolicyEngine-US."""
 
+    # Keys of the dicts returned by the batch calculation methods
+    RESULT_NAMES = (
+        "federal_income_tax",
+        "state_income_tax",
+        "taxable_income",
+        "total_tax",
+        "effective_tax_rate",
+    )
+
+    # Upper bound on cached scenario results; least recently used entries are
+    # evicted first. Each entry is its own copied 5-value ndarray plus its
+    # key, roughly 400 bytes, so a full cache holds about 80 MB in every
+    # process that runs simulations (the main process and each spawned worker).
+    CACHE_MAX_ENTRIES = 200_000
+
+    # Results of calculate_unique_taxes rows, keyed by (state, year, filing
+    # status, key row bytes). Shared by all instances: tax year and age both
+    # advance each simulation year, so reuse comes from repeated and
+    # comparison runs (allocations, SS timing) over the same scenarios.
+    # Simulations run on several threads (the streaming endpoint and the
+    # executor fallback), so lookups, inserts and eviction hold _cache_lock.
+    _cache: OrderedDict[tuple[str, int, str, bytes], np.ndarray] = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    # Microsimulations kept for reuse, keyed by (state, padded batch size).
+    # Shared by all instances so a new request skips building the
+    # simulation; a caller pops its simulation while using it, so
+    # concurrent requests never share one. The tax year is left out of the
+    # key, since each simulation year would otherwise build its own: reuse
+    # drops every computed array and re-sets every input for the new year.
+    MAX_CACHED_SIMULATIONS = 8
+    _simulations: dict[tuple[str, int], Microsimulation] = {}
+    _simulations_lock = threading.Lock()
+
     def __init__(self, state: str = "CA", year: int = 2025):
         self.state = state
         self.year = year
@@ -119,16 +232,19 @@ class TaxCalculator:
     def calculate_batch_taxes(
         self,
         capital_gains_array: np.ndarray,
-        social_security_array: np.ndarray,
-        ages: np.ndarray,
+        social_security_array: np.ndarray | float,
+        ages: np.ndarray | int,
         filing_status: str = "SINGLE",
-        dividend_income_array: np.ndarray | None = None,
-        employment_income_array: np.ndarray | None = None,
+        dividend_income_array: np.ndarray | float | None = None,
+        employment_income_array: np.ndarray | float | None = None,
         year: int | None = None,
     ) -> dict[str, np.ndarray]:
         """
         Calculate taxes for a batch of scenarios using PolicyEngine-US.
 
+        Inputs other than capital_gains_array may be scalars shared by every
+        scenario; they are broadcast to the batch length.
+
         Args:
             year: Calendar year for tax calculation. If None, uses self.year.
                   PolicyEngine inflates tax brackets, so future years will
@@ -137,47 +253,253 @@ class TaxCalculator:
         n_scenarios = len(capital_gains_array)
         calc_year = year if year is not None else self.year
 
-        if dividend_income_array is None:
-            dividend_income_array = np.zeros(n_scenarios)
+        social_security_array = _as_scenario_array(social_security_array, n_scenarios)
+        ages = _as_scenario_array(ages, n_scenarios)
+        dividend_income_array = _as_scenario_array(
+            0.0 if dividend_income_array is None else dividend_income_array,
+            n_scenarios,
+        )
+        employment_income_array = _as_scenario_array(
+            0.0 if employment_income_array is None else employment_income_array,
+            n_scenarios,
+        )
 
-        if employment_income_array is None:
-            employment_income_array = np.zeros(n_scenarios)
+        # Pad to a bucketed batch size (repeating the last scenario) so a
+        # Microsimulation built for one call can be reused by later calls
+        n_rows = _padded_batch_size(n_scenarios)
+        padding = (0, n_rows - n_scenarios)
+        scenario = {
+            "n_scenarios": n_rows,
+            "capital_gains_array": np.pad(capital_gains_array, padding, "edge"),
+            "social_security_array": np.pad(social_security_array, padding, "edge"),
+            "ages": np.pad(ages, padding, "edge"),
+            "state": self.state,
+            "year": calc_year,
+            "filing_status": filing_status,
+            "dividend_income_array": np.pad(dividend_income_array, padding, "edge"),
+            "employment_income_array": np.pad(employment_income_array, padding, "edge"),
+        }
+        sim = self._get_simulation(scenario)
 
-        dataset = MonteCarloDataset(
-            n_scenarios=n_scenarios,
-            capital_gains_array=capital_gains_array,
-            social_security_array=social_security_array,
-            ages=ages,
-            state=self.state,
-            year=calc_year,
-            filing_status=filing_status,
-            dividend_income_array=dividend_income_array,
-            employment_income_array=employment_income_array,
+        variables = {
+            "federal_income_tax": "income_tax",
+            "state_income_tax": "state_income_tax",
+            "taxable_income": "taxable_income",
+        }
+        # State tax is zero by construction here; skip its formula graph
+        if self.state in NO_INCOME_TAX_STATES:
+            del variables["state_income_tax"]
+
+        results = {
+            name: np.asarray(sim.calculate(variable, calc_year))[:n_scenarios]
+            for name, variable in variables.items()
+        }
+        self._release_simulation(scenario, sim)
+        results.setdefault(
+            "state_income_tax", np.zeros_like(results["federal_income_tax"])
         )
 
-        try:
-            dataset.generate()
+        results["total_tax"] = (
+            results["federal_income_tax"] + results["state_income_tax"]
+        )
+
+        # Sum in place and divide only where income is positive, so there
+        # are no quotient or masked-copy temporaries (and no 0/0 warnings)
+        total_income = np.add(capital_gains_array, social_security_array, dtype=float)
+        total_income += dividend_income_array
+        results["effective_tax_rate"] = np.divide(
+            results["total_tax"],
+            total_income,
+            out=np.zeros_like(total_income),
+            where=total_income > 0,
+        )
+
+        return results
+
+    def _get_simulation(self, scenario: dict) -> Microsimulation:
+        """
+        Return a Microsimulation holding the given scenario inputs.
+
+        A pooled simulation already built for the same state and batch size
+        is reused: its calculated values are dropped and its inputs
+        overwritten, which skips rebuilding the dataset and the entity
+        structure. Hand it back with _release_simulation once done.
 
+        Args:
+            scenario: MonteCarloDataset keyword arguments.
+        """
+        key = (scenario["state"], scenario["n_scenarios"])
+        with self._simulations_lock:
+            sim = self._simulations.pop(key, None)
+
+        if sim is None:
+            dataset = MonteCarloDataset(**scenario)
+            dataset.generate()
             sim = Microsimulation(dataset=dataset)
+        else:
+            sim.drop_computed_arrays()
+            # Branches created by formulas (e.g. itemization comparisons)
+            # keep their own values; start them again from the new inputs
+            sim.branches.clear()
+            year = scenario["year"]
+            inputs = _scenario_inputs(**scenario, fields=SCENARIO_FIELDS)
+            for variable, values in inputs.items():
+                if variable in sim.tax_benefit_system.variables:
+                    sim.delete_arrays(variable)
+                    sim.set_input(variable, year, values[year])
+
+        return sim
+
+    def _release_simulation(self, scenario: dict, sim: Microsimulation) -> None:
+        """Return a simulation to the shared pool, evicting the oldest."""
+        key = (scenario["state"], scenario["n_scenarios"])
+        with self._simulations_lock:
+            self._simulations[key] = sim
+            while len(self._simulations) > self.MAX_CACHED_SIMULATIONS:
+                del self._simulations[next(iter(self._simulations))]
+
+    def warm_up(self) -> None:
+        """
+        Build and evaluate a one-scenario simulation.
+
+        Loads the PolicyEngine tax-benefit system and caches the simulation,
+        so the first request in a process doesn't pay for either.
+        """
+        self.calculate_batch_taxes(
+            capital_gains_array=np.zeros(1),
+            social_security_array=0.0,
+            ages=65,
+        )
 
-            results = {
-                "federal_income_tax": sim.calculate("income_tax", calc_year),
-                "state_income_tax": sim.calculate("state_income_tax", calc_year),
-                "taxable_income": sim.calculate("taxable_income", calc_year),
+    def calculate_unique_taxes(
+        self,
+        capital_gains_array: np.ndarray,
+        social_security_array: np.ndarray | float,
+        ages: np.ndarray | int,
+        filing_status: str = "SINGLE",
+        dividend_income_array: np.ndarray | float | None = None,
+        employment_income_array: np.ndarray | float | None = None,
+        year: int | None = None,
+        rounding: float = 100.0,
+        active: np.ndarray | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Calculate taxes for a batch, evaluating each distinct scenario once.
+
+        Incomes are rounded to the nearest `rounding` dollars so that paths
+        with near-identical inputs collapse to a single PolicyEngine row.
+        Results are scattered back to the original batch order. As with
+        calculate_batch_taxes, inputs other than capital_gains_array may be
+        scalars.
+
+        Args:
+            rounding: Dollar bucket for incomes. Use 0 to deduplicate only
+                exactly identical scenarios.
+            active: Optional boolean mask of scenarios to evaluate. Inactive
+                scenarios are dropped before calling PolicyEngine and get
+                zero for every result.
+        """
+        n_scenarios = len(capital_gains_array)
+        rows = slice(None) if active is None else np.flatnonzero(active)
+
+        if dividend_income_array is None:
+            dividend_income_array = 0.0
+
+        if employment_income_array is None:
+            employment_income_array = 0.0
+
+        incomes = np.column_stack(
+            [
+                np.broadcast_to(values, n_scenarios)[rows]
+                for values in (
+                    capital_gains_array,
+                    social_security_array,
+                    dividend_income_array,
+                    employment_income_array,
+                )
+            ]
+        ).astype(float)
+        if rounding > 0:
+            incomes = np.round(incomes / rounding) * rounding
+
+        if len(incomes) == 0:
+            zeros = np.zeros(n_scenarios)
+            return {name: zeros.copy() for name in self.RESULT_NAMES}
+
+        keys = np.column_stack([incomes, np.broadcast_to(ages, n_scenarios)[rows]])
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        unique_values = self._cached_batch_taxes(unique_keys, filing_status, year)
+        unique_results = {
+            name: unique_values[:, i] for i, name in enumerate(self.RESULT_NAMES)
+        }
+
+        if active is None:
+            return {
+                name: np.asarray(values)[inverse]
+                for name, values in unique_results.items()
             }
 
-            results["total_tax"] = (
-                results["federal_income_tax"] + results["state_income_tax"]
-            )
+        results = {}
+        for name, values in unique_results.items():
+            results[name] = np.zeros(n_scenarios)
+            results[name][rows] = np.asarray(values)[inverse]
+        return results
+
+    def _cached_batch_taxes(
+        self,
+        unique_keys: np.ndarray,
+        filing_status: str,
+        year: int | None,
+    ) -> np.ndarray:
+        """
+        Look up results for deduplicated key rows, calculating only misses.
+
+        Args:
+            unique_keys: (n, 5) rows of capital gains, Social Security,
+                dividends, employment income and age.
+
+        Returns:
+            (n, len(RESULT_NAMES)) array of results in RESULT_NAMES order.
+        """
+        calc_year = year if year is not None else self.year
+        cache_keys = [
+            (self.state, calc_year, filing_status, row.tobytes()) for row in unique_keys
+        ]
+        values = []
+        with self._cache_lock:
+            for key in cache_keys:
+                row_values = self._cache.get(key)
+                if row_values is not None:
+                    self._cache.move_to_end(key)
+                values.append(row_values)
+        misses = [i for i, row_values in enumerate(values) if row_values is None]
 
-            total_income = (
-                capital_gains_array + social_security_array + dividend_income_array
+        if misses:
+            miss_keys = unique_keys[misses]
+            miss_results = self.calculate_batch_taxes(
+                capital_gains_array=miss_keys[:, 0],
+                social_security_array=miss_keys[:, 1],
+                ages=miss_keys[:, 4].astype(int),
+                filing_status=filing_status,
+                dividend_income_array=miss_keys[:, 2],
+                employment_income_array=miss_keys[:, 3],
+                year=calc_year,
             )
-            results["effective_tax_rate"] = np.where(
-                total_income > 0, results["total_tax"] / total_income, 0
+            miss_values = np.column_stack(
+                [
+                    np.asarray(miss_results[name], dtype=float)
+                    for name in self.RESULT_NAMES
+                ]
             )
+            with self._cache_lock:
+                for i, row_values in zip(misses, miss_values, strict=True):
+                    values[i] = row_values
+                    # Copy so an entry doesn't keep its whole miss batch alive
+                    self._cache[cache_keys[i]] = row_values.copy()
 
-            return results
+                while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
 
-        finally:
-            dataset.cleanup()
+        return np.array(values).reshape(len(unique_keys), len(self.RESULT_NAMES))
@@ -1,8 +1,20 @@
 """EggNest API - Main FastAPI application."""
 
+import asyncio
+import hashlib
 import json
-
-from fastapi import Depends, FastAPI, Header, HTTPException
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
+
+import numpy as np
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
@@ -29,7 +41,7 @@ from eggnest.models import (
     StateComparisonResult,
     StateResult,
 )
-from eggnest.mortality import calculate_survival_curve, get_mortality_rates
+from eggnest.mortality import calculate_survival_curve, tabulated_mortality_rates
 from eggnest.returns import get_historical_stats
 from eggnest.simulation import MonteCarloSimulator, compare_to_annuity
 from eggnest.ss_timing import (
@@ -42,6 +54,70 @@ from eggnest.supabase_client import (
     save_simulation,
     verify_jwt,
 )
+from eggnest.tax import TaxCalculator
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_tax_calculators(states: list[str]) -> None:
+    """Load PolicyEngine and build each state's simulation in this process."""
+    for state in states:
+        TaxCalculator(state=state).warm_up()
+
+
+def _worker_pid() -> int:
+    """Return this process's pid after a short pause.
+
+    The pause keeps a warm worker busy, so idle ones take the other tasks.
+    """
+    time.sleep(0.05)
+    return os.getpid()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load PolicyEngine before serving, so no request pays the cold start.
+
+    Simulation workers are spawned rather than forked, so they never inherit
+    a lock held by another server thread and behave the same on every
+    platform; each warms its own tax calculators as it starts. The pool
+    starts workers lazily, and a worker that finishes warming first can
+    take several tasks, so rounds of one no-op per worker are run until
+    every worker has answered, i.e. has finished its initializer. Startup
+    waits at most simulation_warmup_timeout seconds; workers still warming
+    then only start taking runs once their initializer returns.
+    """
+    settings = get_settings()
+    _warm_tax_calculators(settings.tax_warm_states)
+    n_workers = settings.simulation_workers
+    pool = ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_warm_tax_calculators,
+        initargs=(settings.tax_warm_states,),
+    )
+    warm_pids: set[int] = set()
+    try:
+        async with asyncio.timeout(settings.simulation_warmup_timeout):
+            while len(warm_pids) < n_workers:
+                warm_pids.update(
+                    await asyncio.gather(
+                        *(
+                            asyncio.wrap_future(pool.submit(_worker_pid))
+                            for _ in range(n_workers)
+                        )
+                    )
+                )
+    except TimeoutError:
+        logger.warning(
+            f"{len(warm_pids)} of {n_workers} simulation workers warmed up "
+            f"within {settings.simulation_warmup_timeout}s; serving anyway"
+        )
+    app.state.simulation_pool = pool
+    yield
+    pool.shutdown()
+
 
 app = FastAPI(
     title="EggNest API",
@@ -73,6 +149,7 @@ print(f"Success rate: {result['success_rate']:.1%}")
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 settings = get_settings()
@@ -88,6 +165,69 @@ app.add_middleware(
 )
 
 
+@dataclass
+class SimulationRun:
+    """What the endpoints read from a finished simulation.
+
+    Only the result and the per-path totals compare_to_annuity needs, so
+    cache entries and worker replies stay small; the simulator itself holds
+    return tensors and tax state sized by n_years x n_sims.
+    """
+
+    result: SimulationResult
+    total_withdrawn: np.ndarray
+    total_taxes: np.ndarray
+
+
+# Runs, keyed by a hash of their input, so an identical re-submitted input
+# skips the Monte Carlo run. Entries are futures stored as soon as a run
+# starts, so concurrent identical requests await the same run; failed runs
+# are dropped. Least recently used entries are evicted first.
+SIMULATION_CACHE_SIZE = 256
+_simulation_cache: OrderedDict[bytes, asyncio.Future[SimulationRun]] = OrderedDict()
+
+
+def _simulate(params: SimulationInput) -> SimulationRun:
+    """Run a simulation; module-level so worker processes can unpickle it."""
+    simulator = MonteCarloSimulator(params)
+    result = simulator.run()
+    return SimulationRun(
+        result=result,
+        total_withdrawn=simulator._total_withdrawn,
+        total_taxes=simulator._total_taxes,
+    )
+
+
+def _forget_failed_run(key: bytes, future: asyncio.Future[SimulationRun]) -> None:
+    """Drop a run that failed from the cache, so the next request retries it."""
+    if future.cancelled() or future.exception() is not None:
+        if _simulation_cache.get(key) is future:
+            del _simulation_cache[key]
+
+
+async def _run_simulation(params: SimulationInput) -> SimulationRun:
+    """
+    Return the run of params, reusing a cached or in-flight one if any.
+
+    New runs go to the simulation worker pool, keeping the event loop free
+    for other requests. Without the pool (the lifespan hasn't run, e.g. a
+    plain TestClient) they use the loop's default thread pool.
+    """
+    key = hashlib.blake2b(params.model_dump_json().encode(), digest_size=16).digest()
+    future = _simulation_cache.get(key)
+    if future is not None:
+        _simulation_cache.move_to_end(key)
+    else:
+        pool = getattr(app.state, "simulation_pool", None)
+        future = asyncio.get_running_loop().run_in_executor(pool, _simulate, params)
+        future.add_done_callback(partial(_forget_failed_run, key))
+        _simulation_cache[key] = future
+        if len(_simulation_cache) > SIMULATION_CACHE_SIZE:
+            _simulation_cache.popitem(last=False)
+    # Shielded so one disconnecting client doesn't cancel the shared run
+    return await asyncio.shield(future)
+
+
 async def get_current_user(authorization: str | None = Header(None)) -> dict | None:
     """Extract and verify user from Authorization header."""
     if not authorization:
@@ -133,8 +273,7 @@ async def run_simulation(params: SimulationInput):
             detail=f"n_simulations cannot exceed {settings.max_n_simulations}",
         )
 
-    simulator = MonteCarloSimulator(params)
-    return simulator.run()
+    return (await _run_simulation(params)).result
 
 
 @app.post("/simulate/stream")
@@ -165,8 +304,24 @@ async def run_simulation_stream(params: SimulationInput):
     )
 
 
+# Mortality rates come from a static table, so clients and CDNs may cache
+# them for a day
+MORTALITY_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+
+@lru_cache(maxsize=512)
+def _mortality_rates(gender: str, start_age: int, end_age: int) -> MortalityRates:
+    """Build the mortality table response for one gender and age range."""
+    ages = list(range(start_age, end_age + 1))
+    rates = tabulated_mortality_rates(ages, gender).tolist()
+    survival = calculate_survival_curve(start_age, end_age + 1, gender)
+    return MortalityRates(ages=ages, rates=rates, survival_curve=survival)
+
+
 @app.get("/mortality/{gender}", response_model=MortalityRates)
-async def get_mortality(gender: str, start_age: int = 65, end_age: int = 100):
+async def get_mortality(
+    gender: str, response: Response, start_age: int = 65, end_age: int = 100
+):
     """
     Get mortality rates and survival curve for a given gender.
 
@@ -175,17 +330,8 @@ async def get_mortality(gender: str, start_age: int = 65, end_age: int = 100):
     if gender not in ["male", "female"]:
         raise HTTPException(status_code=400, detail="Gender must be 'male' or 'female'")
 
-    mortality_rates = get_mortality_rates(gender)
-    ages = list(range(start_age, end_age + 1))
-    rates = [
-        mortality_rates.get(
-            age, mortality_rates[max(k for k in mortality_rates if k <= age)]
-        )
-        for age in ages
-    ]
-    survival = calculate_survival_curve(start_age, end_age + 1, gender)
-
-    return MortalityRates(ages=ages, rates=rates, survival_curve=survival)
+    response.headers["Cache-Control"] = MORTALITY_CACHE_CONTROL
+    return _mortality_rates(gender, start_age, end_age)
 
 
 @app.post("/compare-annuity", response_model=AnnuityComparisonResult)
@@ -195,8 +341,8 @@ async def compare_annuity_endpoint(comparison: AnnuityComparison):
 
     Returns comparison metrics and a recommendation.
     """
-    simulator = MonteCarloSimulator(comparison.simulation_input)
-    sim_result = simulator.run()
+    run = await _run_simulation(comparison.simulation_input)
+    sim_result = run.result
 
     n_years = (
         comparison.simulation_input.max_age - comparison.simulation_input.current_age
@@ -206,8 +352,8 @@ async def compare_annuity_endpoint(comparison: AnnuityComparison):
         annuity_monthly_payment=comparison.annuity_monthly_payment,
         annuity_guarantee_years=comparison.annuity_guarantee_years,
         n_years=n_years,
-        total_withdrawn=simulator._total_withdrawn,
-        total_taxes=simulator._total_taxes,
+        total_withdrawn=run.total_withdrawn,
+        total_taxes=run.total_taxes,
     )
 
     return AnnuityComparisonResult(
@@ -478,18 +624,9 @@ async def compare_life_event_endpoint(comparison: LifeEventComparisonInput):
 @app.get("/simulations", response_model=list[SavedSimulation])
 async def list_simulations(user: dict = Depends(require_user)):  # noqa: B008
     """List all saved simulations for the current user."""
-    simulations = await get_user_simulations(user["id"])
-    return [
-        SavedSimulation(
-            id=s["id"],
-            user_id=s["user_id"],
-            name=s["name"],
-            input_params=SimulationInput(**s["input_params"]),
-            created_at=s.get("created_at"),
-            updated_at=s.get("updated_at"),
-        )
-        for s in simulations
-    ]
+    # Rows are validated (and extra columns dropped) once, by the response
+    # model; building SavedSimulation models here would validate them twice
+    return await get_user_simulations(user["id"])
 
 
 @app.post("/simulations", response_model=SavedSimulation)
@@ -504,13 +641,7 @@ async def create_simulation(
     )
     if not result:
         raise HTTPException(status_code=500, detail="Failed to save simulation")
-    return SavedSimulation(
-        id=result["id"],
-        user_id=result["user_id"],
-        name=result["name"],
-        input_params=SimulationInput(**result["input_params"]),
-        created_at=result.get("created_at"),
-    )
+    return result
 
 
 @app.delete("/simulations/{simulation_id}")
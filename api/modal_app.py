@@ -10,7 +10,7 @@ image = (
         "uvicorn[standard]>=0.27.0",
         "pydantic>=2.5.0",
         "pydantic-settings>=2.1.0",
-        "numpy>=1.24.0",
+        "numpy>=1.25.0",
         "numpy-financial>=1.0.0",
         "pandas>=2.0.0",
         "scipy>=1.10.0",
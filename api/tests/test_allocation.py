@@ -5,12 +5,29 @@ import pytest
 
 from eggnest.returns import (
     SP500_DIVIDEND_RETURNS,
+    SP500_PRICE_ARRAY,
     SP500_PRICE_RETURNS,
+    TREASURY_PRICE_ARRAY,
     TREASURY_RETURNS,
     generate_blended_returns,
 )
 
 
+@pytest.fixture(scope="module")
+def blended_price_returns():
+    """Bootstrap price returns at 0%, 60% and 100% stocks, generated once."""
+    return {
+        allocation: generate_blended_returns(
+            n_simulations=1000,
+            n_years=30,
+            stock_allocation=allocation,
+            method="bootstrap",
+            rng=np.random.default_rng(42),
+        )[0]
+        for allocation in (0.0, 0.6, 1.0)
+    }
+
+
 class TestBondReturns:
     """Test bond returns data."""
 
@@ -32,8 +49,7 @@ class TestBondReturns:
 
     def test_bond_mean_return_reasonable(self):
         """Test that mean bond return is in a reasonable range (nominal ~5%)."""
-        returns = list(TREASURY_RETURNS.values())
-        mean_return = np.mean(returns)
+        mean_return = np.mean(TREASURY_PRICE_ARRAY)
         # Historical nominal bond returns average around 5% (2% real + 3% inflation)
         assert (
             0.02 <= mean_return <= 0.08
@@ -41,8 +57,8 @@ class TestBondReturns:
 
     def test_bond_volatility_lower_than_stocks(self):
         """Test that bonds are less volatile than stocks."""
-        bond_std = np.std(list(TREASURY_RETURNS.values()))
-        stock_std = np.std(list(SP500_PRICE_RETURNS.values()))
+        bond_std = np.std(TREASURY_PRICE_ARRAY)
+        stock_std = np.std(SP500_PRICE_ARRAY)
         # Bonds should be less volatile than stocks
         assert bond_std < stock_std
 
@@ -50,64 +66,19 @@ class TestBondReturns:
 class TestBlendedReturns:
     """Test blended stock/bond returns generation."""
 
-    def test_0_percent_stocks(self):
+    def test_0_percent_stocks(self, blended_price_returns):
         """Test that 0% stocks (100% bonds) has lower volatility."""
-        rng = np.random.default_rng(42)
-        bond_price, bond_div = generate_blended_returns(
-            n_simulations=1000,
-            n_years=30,
-            stock_allocation=0.0,
-            method="bootstrap",
-            rng=rng,
-        )
-
-        rng = np.random.default_rng(42)
-        stock_price, stock_div = generate_blended_returns(
-            n_simulations=1000,
-            n_years=30,
-            stock_allocation=1.0,
-            method="bootstrap",
-            rng=rng,
-        )
-
-        bond_std = np.std(bond_price)
-        stock_std = np.std(stock_price)
+        bond_std = np.std(blended_price_returns[0.0])
+        stock_std = np.std(blended_price_returns[1.0])
 
         # All bonds should be less volatile than all stocks
         assert bond_std < stock_std
 
-    def test_60_40_allocation(self):
+    def test_60_40_allocation(self, blended_price_returns):
         """Test 60/40 allocation produces intermediate volatility."""
-        rng = np.random.default_rng(42)
-        price_60_40, _ = generate_blended_returns(
-            n_simulations=1000,
-            n_years=30,
-            stock_allocation=0.6,
-            method="bootstrap",
-            rng=rng,
-        )
-
-        rng = np.random.default_rng(42)
-        price_100_0, _ = generate_blended_returns(
-            n_simulations=1000,
-            n_years=30,
-            stock_allocation=1.0,
-            method="bootstrap",
-            rng=rng,
-        )
-
-        rng = np.random.default_rng(42)
-        price_0_100, _ = generate_blended_returns(
-            n_simulations=1000,
-            n_years=30,
-            stock_allocation=0.0,
-            method="bootstrap",
-            rng=rng,
-        )
-
-        std_60_40 = np.std(price_60_40)
-        std_100_0 = np.std(price_100_0)
-        std_0_100 = np.std(price_0_100)
+        std_60_40 = np.std(blended_price_returns[0.6])
+        std_100_0 = np.std(blended_price_returns[1.0])
+        std_0_100 = np.std(blended_price_returns[0.0])
 
         # 60/40 should be between all stocks and all bonds
         assert std_0_100 < std_60_40 < std_100_0
@@ -166,6 +137,37 @@ class TestBlendedReturns:
         # 80% * 7% + 20% * 2% = 6% (but this is price return, so a bit lower)
         assert 0.02 <= mean_return <= 0.10
 
+    @pytest.mark.parametrize(
+        "method", ["bootstrap", "block_bootstrap", "historical", "normal"]
+    )
+    def test_out_buffers_match_allocated_returns(self, method):
+        """Writing into caller buffers should give the same returns."""
+        expected = generate_blended_returns(
+            n_simulations=50,
+            n_years=10,
+            stock_allocation=0.6,
+            method=method,
+            rng=np.random.default_rng(7),
+        )
+
+        # Transposed views of year-major buffers, as the simulator would pass
+        out_price = np.empty((10, 50)).T
+        out_div = np.empty((10, 50)).T
+        price, div = generate_blended_returns(
+            n_simulations=50,
+            n_years=10,
+            stock_allocation=0.6,
+            method=method,
+            rng=np.random.default_rng(7),
+            out_price=out_price,
+            out_div=out_div,
+        )
+
+        assert price is out_price
+        assert div is out_div
+        np.testing.assert_allclose(price, expected[0], atol=1e-6)
+        np.testing.assert_array_equal(div, expected[1])
+
 
 class TestHistoricalData:
     """Test historical data is reasonable."""
@@ -186,10 +188,10 @@ class TestHistoricalData:
 
     def test_bond_stats_reasonable(self):
         """Test that bond stats are reasonable."""
-        bond_mean = np.mean(list(TREASURY_RETURNS.values()))
-        bond_std = np.std(list(TREASURY_RETURNS.values()))
-        stock_mean = np.mean(list(SP500_PRICE_RETURNS.values()))
-        stock_std = np.std(list(SP500_PRICE_RETURNS.values()))
+        bond_mean = np.mean(TREASURY_PRICE_ARRAY)
+        bond_std = np.std(TREASURY_PRICE_ARRAY)
+        stock_mean = np.mean(SP500_PRICE_ARRAY)
+        stock_std = np.std(SP500_PRICE_ARRAY)
 
         # Bond mean should be lower than stock mean
         assert (
@@ -1,10 +1,16 @@
 """Tests for holdings-based portfolio model and RMD calculations."""
 
 import numpy as np
+import pytest
 
 from eggnest.holdings import HoldingsTracker, create_holdings_tracker
 from eggnest.models import Holding, SimulationInput
-from eggnest.rmd import RMD_START_AGE, calculate_rmd, get_rmd_factor
+from eggnest.rmd import (
+    RMD_START_AGE,
+    calculate_rmd,
+    get_rmd_divisor,
+    get_rmd_factor,
+)
 
 
 class TestHoldingModel:
@@ -17,23 +23,20 @@ class TestHoldingModel:
         assert h.fund == "vt"
         assert h.balance == 100_000
 
-    def test_holding_account_types(self):
+    @pytest.mark.parametrize(
+        "account_type",
+        ["traditional_401k", "traditional_ira", "roth_401k", "roth_ira", "taxable"],
+    )
+    def test_holding_account_types(self, account_type):
         """Test all account types are valid."""
-        for account_type in [
-            "traditional_401k",
-            "traditional_ira",
-            "roth_401k",
-            "roth_ira",
-            "taxable",
-        ]:
-            h = Holding(account_type=account_type, fund="vt", balance=1000)
-            assert h.account_type == account_type
-
-    def test_holding_fund_types(self):
+        h = Holding(account_type=account_type, fund="vt", balance=1000)
+        assert h.account_type == account_type
+
+    @pytest.mark.parametrize("fund", ["vt", "sp500", "bnd", "treasury"])
+    def test_holding_fund_types(self, fund):
         """Test all fund types are valid."""
-        for fund in ["vt", "sp500", "bnd", "treasury"]:
-            h = Holding(account_type="taxable", fund=fund, balance=1000)
-            assert h.fund == fund
+        h = Holding(account_type="taxable", fund=fund, balance=1000)
+        assert h.fund == fund
 
 
 class TestSimulationInputWithHoldings:
@@ -121,16 +124,18 @@ class TestSimulationInputWithHoldings:
 class TestRMD:
     """Test RMD calculations."""
 
-    def test_rmd_before_start_age(self):
-        """Test RMD is 0 before RMD start age."""
-        assert calculate_rmd(500_000, 65) == 0
-        assert calculate_rmd(500_000, 72) == 0
-
-    def test_rmd_at_start_age(self):
-        """Test RMD at age 73."""
-        rmd = calculate_rmd(500_000, 73)
-        # 500,000 / 26.5 = 18,867.92
-        assert abs(rmd - 18_867.92) < 1
+    @pytest.mark.parametrize(
+        "balance,age,expected",
+        [
+            (500_000, 65, 0),  # Before start age
+            (500_000, 72, 0),
+            (500_000, 73, 18_867.92),  # 500,000 / 26.5
+            (0, 80, 0),  # Zero balance
+        ],
+    )
+    def test_calculate_rmd(self, balance, age, expected):
+        """Test RMD amounts around the start age and with no balance."""
+        assert calculate_rmd(balance, age) == pytest.approx(expected, rel=1e-4)
 
     def test_rmd_increases_with_age(self):
         """Test RMD factor increases with age (shorter distribution period)."""
@@ -140,15 +145,22 @@ class TestRMD:
 
         assert factor_75 < factor_85 < factor_95
 
-    def test_rmd_zero_balance(self):
-        """Test RMD is 0 with zero balance."""
-        assert calculate_rmd(0, 80) == 0
-
     def test_rmd_factor_before_start(self):
         """Test RMD factor is 0 before start age."""
         assert get_rmd_factor(60) == 0
         assert get_rmd_factor(72) == 0
 
+    def test_rmd_divisor(self):
+        """Test divisors come from the Uniform Lifetime Table, capped at 120."""
+        assert get_rmd_divisor(75) == 24.6
+        assert get_rmd_divisor(125) == get_rmd_divisor(120)
+        assert get_rmd_factor(75) == 1 / get_rmd_divisor(75)
+
+    def test_rmd_divisor_before_table(self):
+        """Test ages below the Uniform Lifetime Table raise ValueError."""
+        with pytest.raises(ValueError, match="age 60"):
+            get_rmd_divisor(60)
+
     def test_rmd_start_age_constant(self):
         """Test RMD start age is 73 per SECURE 2.0."""
         assert RMD_START_AGE == 73
@@ -1,7 +1,9 @@
 """Tests for the Monte Carlo simulation engine."""
 
+import numpy as np
+
 from eggnest.models import SimulationInput
-from eggnest.simulation import MonteCarloSimulator
+from eggnest.simulation import MonteCarloSimulator, _failure_years
 
 
 def test_simulation_basic():
@@ -91,3 +93,43 @@ def test_simulation_percentiles_ordered():
     assert result.percentiles["p25"] <= result.percentiles["p50"]
     assert result.percentiles["p50"] <= result.percentiles["p75"]
     assert result.percentiles["p75"] <= result.percentiles["p95"]
+
+
+def test_simulation_parallel_chunks():
+    """Test that sharding across worker processes is seeded and covers all paths."""
+    params = SimulationInput(
+        initial_capital=1_000_000,
+        annual_spending=48000,
+        current_age=65,
+        max_age=75,
+        gender="male",
+        state="CA",
+        filing_status="single",
+        n_simulations=100,
+    )
+
+    result = MonteCarloSimulator(params, seed=42).run(n_workers=2)
+    repeat = MonteCarloSimulator(params, seed=42).run(n_workers=2)
+
+    assert 0 <= result.success_rate <= 1
+    assert len(result.percentile_paths["p50"]) == 11  # n_years + 1
+    assert result.percentiles == repeat.percentiles
+
+
+def test_failure_years_ignores_years_after_every_path_died():
+    """Test that paths that die with money left are not counted as depleted."""
+    # Year-major paths; the run stopped after year 2 once every path had died,
+    # leaving the skipped years at zero
+    paths = np.array(
+        [
+            [100.0, 100.0, 100.0],
+            [80.0, 0.0, 90.0],
+            [60.0, 0.0, 80.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+        ]
+    )
+
+    failure_year = _failure_years(paths, years_run=2)
+
+    np.testing.assert_array_equal(failure_year, [5.0, 1.0, 5.0])
@@ -1,51 +1,93 @@
 """Tests for simulation with holdings-based portfolios (TDD)."""
 
+import pytest
+
 from eggnest.models import Holding, SimulationInput
 from eggnest.simulation import MonteCarloSimulator
 
-
-class TestSimulationWithHoldings:
-    """Test simulation runs with holdings input."""
-
-    def test_simulation_uses_holdings_tracker(self):
-        """Simulation should create and use HoldingsTracker when holdings provided."""
+# Every test here runs full simulations; fixtures are module-scoped, so run
+# in parallel with --dist=loadfile to keep each module on one worker
+pytestmark = pytest.mark.slow
+
+
+def _single_account_params(account_type: str) -> SimulationInput:
+    """$500k of VT in one account type, drawn down for ten years in CA."""
+    return SimulationInput(
+        holdings=[
+            Holding(account_type=account_type, fund="vt", balance=500_000),
+        ],
+        annual_spending=50_000,
+        current_age=60,
+        max_age=70,
+        n_simulations=100,
+        state="CA",
+        filing_status="single",
+    )
+
+
+@pytest.fixture(scope="module")
+def taxable_result():
+    """Taxable-account baseline, run once for the tax-treatment comparisons."""
+    return MonteCarloSimulator(_single_account_params("taxable")).run()
+
+
+@pytest.fixture(scope="module")
+def holdings_run():
+    """Simulator and result for a mixed-account portfolio, run once."""
+    params = SimulationInput(
+        holdings=[
+            Holding(account_type="traditional_401k", fund="vt", balance=300_000),
+            Holding(account_type="roth_ira", fund="vt", balance=100_000),
+            Holding(account_type="taxable", fund="bnd", balance=50_000),
+        ],
+        annual_spending=40_000,
+        current_age=60,
+        max_age=90,
+        n_simulations=100,
+    )
+    sim = MonteCarloSimulator(params)
+    return sim, sim.run()
+
+
+@pytest.fixture(scope="module")
+def strategy_results():
+    """Runs of one three-account portfolio under each sequential strategy."""
+    results = {}
+    for strategy in ("taxable_first", "traditional_first"):
+        # Fresh holdings per input, so no run can see another's list
         params = SimulationInput(
             holdings=[
-                Holding(account_type="traditional_401k", fund="vt", balance=300_000),
-                Holding(account_type="roth_ira", fund="vt", balance=100_000),
-                Holding(account_type="taxable", fund="bnd", balance=50_000),
+                Holding(account_type="traditional_401k", fund="vt", balance=200_000),
+                Holding(account_type="roth_ira", fund="vt", balance=200_000),
+                Holding(account_type="taxable", fund="vt", balance=200_000),
             ],
-            annual_spending=40_000,
+            withdrawal_strategy=strategy,
+            annual_spending=50_000,
             current_age=60,
-            max_age=90,
+            max_age=80,
             n_simulations=100,
         )
-        sim = MonteCarloSimulator(params)
+        results[strategy] = MonteCarloSimulator(params).run()
+    return results
+
+
+class TestSimulationWithHoldings:
+    """Test simulation runs with holdings input."""
+
+    def test_simulation_uses_holdings_tracker(self, holdings_run):
+        """Simulation should create and use HoldingsTracker when holdings provided."""
+        sim, result = holdings_run
 
         # Should have tracker attribute after initialization
         assert hasattr(sim, "tracker")
-        # Tracker should be None until run is called, or created during run
-        result = sim.run()
 
         # Should complete without error
         assert result.success_rate >= 0
         assert result.success_rate <= 1
 
-    def test_simulation_accepts_holdings(self):
+    def test_simulation_accepts_holdings(self, holdings_run):
         """Simulation should accept holdings instead of initial_capital."""
-        params = SimulationInput(
-            holdings=[
-                Holding(account_type="traditional_401k", fund="vt", balance=300_000),
-                Holding(account_type="roth_ira", fund="vt", balance=100_000),
-                Holding(account_type="taxable", fund="bnd", balance=50_000),
-            ],
-            annual_spending=40_000,
-            current_age=60,
-            max_age=90,
-            n_simulations=100,
-        )
-        sim = MonteCarloSimulator(params)
-        result = sim.run()
+        _, result = holdings_run
 
         # Should complete without error
         assert result.success_rate >= 0
@@ -61,7 +103,7 @@ class TestSimulationWithHoldings:
             annual_spending=20_000,
             current_age=60,
             max_age=90,
-            n_simulations=1000,
+            n_simulations=100,
         )
         bond_params = SimulationInput(
             holdings=[
@@ -70,16 +112,15 @@ class TestSimulationWithHoldings:
             annual_spending=20_000,
             current_age=60,
             max_age=90,
-            n_simulations=1000,
+            n_simulations=100,
         )
 
-        stock_result = MonteCarloSimulator(stock_params).run()
-        bond_result = MonteCarloSimulator(bond_params).run()
+        stock_result = MonteCarloSimulator(stock_params, seed=0).run()
+        bond_result = MonteCarloSimulator(bond_params, seed=0).run()
 
         # Stock median should be higher (higher expected return)
         # Bond volatility should be lower (more consistent outcomes)
-        # We can't guarantee exact relationships due to randomness,
-        # but over 1000 sims these should hold
+        # Seeded so the outcome doesn't depend on the draw
         assert stock_result.median_final_value != bond_result.median_final_value
 
     def test_rmd_affects_traditional_withdrawals(self):
@@ -101,104 +142,30 @@ class TestSimulationWithHoldings:
         # Simulation should still run successfully
         assert result.success_rate >= 0
 
-    def test_withdrawal_strategy_affects_tax(self):
+    def test_withdrawal_strategy_affects_tax(self, strategy_results):
         """Different withdrawal strategies should affect tax outcomes."""
-        base_holdings = [
-            Holding(account_type="traditional_401k", fund="vt", balance=200_000),
-            Holding(account_type="roth_ira", fund="vt", balance=200_000),
-            Holding(account_type="taxable", fund="vt", balance=200_000),
-        ]
-
-        # Taxable first - capital gains tax
-        taxable_first = SimulationInput(
-            holdings=base_holdings.copy(),
-            withdrawal_strategy="taxable_first",
-            annual_spending=50_000,
-            current_age=60,
-            max_age=80,
-            n_simulations=100,
-        )
-
-        # Traditional first - ordinary income tax
-        traditional_first = SimulationInput(
-            holdings=base_holdings.copy(),
-            withdrawal_strategy="traditional_first",
-            annual_spending=50_000,
-            current_age=60,
-            max_age=80,
-            n_simulations=100,
-        )
-
-        result_taxable = MonteCarloSimulator(taxable_first).run()
-        result_traditional = MonteCarloSimulator(traditional_first).run()
+        result_taxable = strategy_results["taxable_first"]
+        result_traditional = strategy_results["traditional_first"]
 
         # Tax amounts should differ (traditional withdrawals taxed as ordinary income)
         # Can't guarantee which is higher without knowing exact tax brackets
         assert result_taxable.total_taxes_median >= 0
         assert result_traditional.total_taxes_median >= 0
 
-    def test_traditional_withdrawals_treated_as_ordinary_income(self):
+    def test_traditional_withdrawals_treated_as_ordinary_income(self, taxable_result):
         """Traditional account withdrawals should be taxed as ordinary income."""
         # Same dollar amount, but different account types = different tax treatment
-        traditional_params = SimulationInput(
-            holdings=[
-                Holding(account_type="traditional_401k", fund="vt", balance=500_000),
-            ],
-            annual_spending=50_000,
-            current_age=60,
-            max_age=70,
-            n_simulations=100,
-            state="CA",
-            filing_status="single",
-        )
-
-        taxable_params = SimulationInput(
-            holdings=[
-                Holding(account_type="taxable", fund="vt", balance=500_000),
-            ],
-            annual_spending=50_000,
-            current_age=60,
-            max_age=70,
-            n_simulations=100,
-            state="CA",
-            filing_status="single",
-        )
-
-        trad_result = MonteCarloSimulator(traditional_params).run()
-        taxable_result = MonteCarloSimulator(taxable_params).run()
+        trad_result = MonteCarloSimulator(
+            _single_account_params("traditional_401k")
+        ).run()
 
         # Traditional withdrawals should have higher taxes (ordinary income vs capital gains)
         # This will fail until HoldingsTracker is integrated with proper tax treatment
         assert trad_result.total_taxes_median > taxable_result.total_taxes_median
 
-    def test_roth_withdrawals_are_tax_free(self):
+    def test_roth_withdrawals_are_tax_free(self, taxable_result):
         """Roth account withdrawals should not incur taxes."""
-        roth_params = SimulationInput(
-            holdings=[
-                Holding(account_type="roth_ira", fund="vt", balance=500_000),
-            ],
-            annual_spending=50_000,
-            current_age=60,
-            max_age=70,
-            n_simulations=100,
-            state="CA",
-            filing_status="single",
-        )
-
-        taxable_params = SimulationInput(
-            holdings=[
-                Holding(account_type="taxable", fund="vt", balance=500_000),
-            ],
-            annual_spending=50_000,
-            current_age=60,
-            max_age=70,
-            n_simulations=100,
-            state="CA",
-            filing_status="single",
-        )
-
-        roth_result = MonteCarloSimulator(roth_params).run()
-        taxable_result = MonteCarloSimulator(taxable_params).run()
+        roth_result = MonteCarloSimulator(_single_account_params("roth_ira")).run()
 
         # Roth should have near-zero taxes, taxable should have capital gains tax
         assert roth_result.total_taxes_median < taxable_result.total_taxes_median
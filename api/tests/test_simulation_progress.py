@@ -90,3 +90,12 @@ class TestRunWithProgress:
 
         if progress_events:
             assert progress_events[0]["total_years"] == expected_years
+
+    def test_run_after_progress_reuses_result(self, basic_params):
+        """run() after run_with_progress() should return the cached result."""
+        simulator = MonteCarloSimulator(basic_params)
+        events = list(simulator.run_with_progress())
+
+        result = simulator.run()
+
+        assert result.model_dump() == events[-1]["result"]
@@ -0,0 +1,223 @@
+"""Tests for PolicyEngine-backed tax calculations."""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from eggnest.tax import TaxCalculator
+
+
+class TestCalculateUniqueTaxes:
+    """Test deduplicated batch tax calculation."""
+
+    def test_matches_batch_for_exact_inputs(self):
+        """With rounding disabled, results should match the full batch call."""
+        calc = TaxCalculator(state="CA", year=2025)
+        kwargs = {
+            "capital_gains_array": np.array([40_000.0, 0.0, 40_000.0, 10_000.0]),
+            "social_security_array": np.array([24_000.0, 24_000.0, 24_000.0, 0.0]),
+            "ages": np.full(4, 67),
+            "dividend_income_array": np.array([2_000.0, 0.0, 2_000.0, 500.0]),
+            "year": 2025,
+        }
+
+        batch = calc.calculate_batch_taxes(**kwargs)
+        unique = calc.calculate_unique_taxes(rounding=0, **kwargs)
+
+        np.testing.assert_allclose(unique["total_tax"], batch["total_tax"])
+
+    def test_duplicate_scenarios_share_results(self):
+        """Scenarios in the same rounding bucket should get identical taxes."""
+        calc = TaxCalculator(state="CA", year=2025)
+        result = calc.calculate_unique_taxes(
+            capital_gains_array=np.array([50_010.0, 49_990.0, 0.0]),
+            social_security_array=np.full(3, 30_000.0),
+            ages=np.full(3, 67),
+            year=2025,
+        )
+
+        assert result["total_tax"].shape == (3,)
+        assert result["total_tax"][0] == result["total_tax"][1]
+
+    def test_scalar_inputs_broadcast(self):
+        """Scalar incomes and ages should match the equivalent full arrays."""
+        calc = TaxCalculator(state="CA", year=2025)
+        gains = np.array([40_000.0, 0.0, 10_000.0])
+
+        scalar = calc.calculate_batch_taxes(
+            capital_gains_array=gains,
+            social_security_array=24_000.0,
+            ages=67,
+            year=2025,
+        )
+        full = calc.calculate_batch_taxes(
+            capital_gains_array=gains,
+            social_security_array=np.full(3, 24_000.0),
+            ages=np.full(3, 67),
+            year=2025,
+        )
+
+        np.testing.assert_allclose(scalar["total_tax"], full["total_tax"])
+
+    def test_inactive_scenarios_are_zero(self):
+        """Masked-out scenarios should be skipped and report zero tax."""
+        calc = TaxCalculator(state="CA", year=2025)
+        gains = np.array([60_000.0, 60_000.0, 20_000.0])
+
+        result = calc.calculate_unique_taxes(
+            capital_gains_array=gains,
+            social_security_array=30_000.0,
+            ages=67,
+            year=2025,
+            active=np.array([True, False, True]),
+        )
+        full = calc.calculate_unique_taxes(
+            capital_gains_array=gains,
+            social_security_array=30_000.0,
+            ages=67,
+            year=2025,
+        )
+
+        assert result["total_tax"][1] == 0
+        np.testing.assert_allclose(
+            result["total_tax"][[0, 2]], full["total_tax"][[0, 2]]
+        )
+
+    def test_repeat_scenarios_use_cache(self, monkeypatch):
+        """Scenarios already evaluated for a year shouldn't reach PolicyEngine."""
+        calc = TaxCalculator(state="CA", year=2025)
+        kwargs = {
+            "capital_gains_array": np.array([30_000.0, 45_000.0]),
+            "social_security_array": 20_000.0,
+            "ages": 70,
+            "year": 2025,
+        }
+        first = calc.calculate_unique_taxes(**kwargs)
+
+        def fail(*args, **kw):
+            raise AssertionError("cached scenario was recalculated")
+
+        monkeypatch.setattr(calc, "calculate_batch_taxes", fail)
+        second = calc.calculate_unique_taxes(**kwargs)
+
+        np.testing.assert_allclose(second["total_tax"], first["total_tax"])
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """A cache hit should protect its scenario from the next eviction."""
+        monkeypatch.setattr(TaxCalculator, "_cache", OrderedDict())
+        monkeypatch.setattr(TaxCalculator, "CACHE_MAX_ENTRIES", 2)
+        calc = TaxCalculator(state="CA", year=2025)
+        calculated = []
+
+        def fake_batch(capital_gains_array, **kwargs):
+            calculated.extend(capital_gains_array)
+            return {
+                name: np.asarray(capital_gains_array, dtype=float)
+                for name in TaxCalculator.RESULT_NAMES
+            }
+
+        monkeypatch.setattr(calc, "calculate_batch_taxes", fake_batch)
+
+        def run(gains):
+            return calc.calculate_unique_taxes(
+                capital_gains_array=np.array([gains]),
+                social_security_array=0.0,
+                ages=70,
+                year=2025,
+            )
+
+        run(1_000.0)
+        run(2_000.0)
+        run(1_000.0)
+        run(3_000.0)
+        calculated.clear()
+        run(1_000.0)
+        assert calculated == []
+        run(2_000.0)
+        assert calculated == [2_000.0]
+
+    def test_cached_rows_do_not_share_batch_memory(self, monkeypatch):
+        """Each cached row should be a copy, not a view into its miss batch."""
+        monkeypatch.setattr(TaxCalculator, "_cache", OrderedDict())
+        TaxCalculator(state="CA", year=2025).calculate_unique_taxes(
+            capital_gains_array=np.array([11_000.0, 12_000.0]),
+            social_security_array=0.0,
+            ages=71,
+            year=2025,
+        )
+
+        assert len(TaxCalculator._cache) == 2
+        assert all(values.base is None for values in TaxCalculator._cache.values())
+
+
+class TestSimulationPool:
+    """Test reuse of PolicyEngine simulations across calculators."""
+
+    def test_new_calculator_reuses_simulation(self):
+        """A fresh calculator should pick up a simulation built by another."""
+        TaxCalculator(state="CA").warm_up()
+        pooled = TaxCalculator._simulations[("CA", 1)]
+
+        calc = TaxCalculator(state="CA")
+        result = calc.calculate_batch_taxes(
+            capital_gains_array=np.array([25_000.0]),
+            social_security_array=18_000.0,
+            ages=68,
+        )
+
+        assert TaxCalculator._simulations[("CA", 1)] is pooled
+        assert result["total_tax"].shape == (1,)
+
+    def test_pooled_simulation_matches_fresh_across_years(self, monkeypatch):
+        """A simulation reused for another tax year should match a fresh one."""
+        kwargs = {
+            "capital_gains_array": np.array([60_000.0, 5_000.0]),
+            "social_security_array": 30_000.0,
+            "ages": 72,
+            "dividend_income_array": np.array([8_000.0, 1_000.0]),
+            "employment_income_array": np.array([0.0, 40_000.0]),
+        }
+
+        monkeypatch.setattr(TaxCalculator, "_simulations", {})
+        calc = TaxCalculator(state="CA")
+        calc.calculate_batch_taxes(**kwargs, year=2025)
+        pooled = TaxCalculator._simulations[("CA", 2)]
+        reused = calc.calculate_batch_taxes(**kwargs, year=2030)
+        assert TaxCalculator._simulations[("CA", 2)] is pooled
+
+        monkeypatch.setattr(TaxCalculator, "_simulations", {})
+        fresh = TaxCalculator(state="CA").calculate_batch_taxes(**kwargs, year=2030)
+
+        for name in TaxCalculator.RESULT_NAMES:
+            np.testing.assert_allclose(reused[name], fresh[name])
+
+
+class TestStateIncomeTax:
+    """Test that the scenario state reaches PolicyEngine."""
+
+    def test_no_income_tax_state_is_zero(self):
+        """States without an income tax should report zero state tax."""
+        result = TaxCalculator(state="TX").calculate_batch_taxes(
+            capital_gains_array=np.array([80_000.0]),
+            social_security_array=20_000.0,
+            ages=67,
+            dividend_income_array=np.array([10_000.0]),
+        )
+
+        assert result["state_income_tax"][0] == 0
+        assert result["total_tax"][0] == result["federal_income_tax"][0]
+
+    def test_state_changes_state_tax(self):
+        """The same income should be taxed differently in different states."""
+        kwargs = {
+            "capital_gains_array": np.array([80_000.0]),
+            "social_security_array": 20_000.0,
+            "ages": 67,
+            "dividend_income_array": np.array([10_000.0]),
+        }
+        ca = TaxCalculator(state="CA").calculate_batch_taxes(**kwargs)
+        ny = TaxCalculator(state="NY").calculate_batch_taxes(**kwargs)
+
+        assert ca["state_income_tax"][0] > 0
+        assert ny["state_income_tax"][0] > 0
+        assert ca["state_income_tax"][0] != ny["state_income_tax"][0]
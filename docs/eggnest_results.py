@@ -3,20 +3,52 @@ Computed results for the EggNest methodology paper.
 
 This module provides a single source of truth for all numerical values
 cited in the paper. Run this module to regenerate values or import `r`
-for access to precomputed results.
+for access to precomputed results. Run it with
+`--emit docs/_static/results.json` to save the results, so that paper
+builds load them without running any simulations.
 """
 
+import argparse
+import hashlib
+import json
+import os
+import pickle
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any
 
-# Add the API module to path
+# The API package, importable from a source checkout via _api_importable()
 api_path = Path(__file__).parent.parent / "api"
-sys.path.insert(0, str(api_path))
 
+# Paths per strategy simulation (reduced for paper generation speed)
+PAPER_N_SIMULATIONS = 1000
 
-@dataclass
+# Every strategy is simulated with this seed, so all of them see the same
+# market returns and lifespans (common random numbers) and differences
+# between strategies come from the strategies alone
+PAPER_SEED = 20250101
+
+# Results emitted ahead of time with --emit. When present, the paper loads
+# these instead of importing PolicyEngine and running the simulations.
+RESULTS_PAYLOAD = Path(__file__).parent / "_static" / "results.json"
+
+# Computed results are pickled here, so rebuilding the paper doesn't rerun
+# the simulations unless the inputs or code changed
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "eggnest"
+
+
+def _fmt() -> Any:
+    """Formatted-string field: filled in by __post_init__, not passed in."""
+    return field(init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
 class ReferenceCase:
     """Reference case individual for baseline comparisons."""
     age: int = 55
@@ -37,19 +69,21 @@ class ReferenceCase:
     social_security_monthly: int = 2_500
     social_security_start_age: int = 67
 
-    @property
-    def description(self) -> str:
-        return f"{self.age}-year-old {self.gender} in {self.state}"
+    # Formatted once here rather than on every read by the paper
+    description: str = _fmt()
+    portfolio_description: str = _fmt()
 
-    @property
-    def portfolio_description(self) -> str:
-        return (f"${self.initial_capital:,} total "
-                f"(${self.traditional_401k:,} traditional 401k, "
-                f"${self.roth_ira:,} Roth IRA, "
-                f"${self.taxable:,} taxable)")
+    def __post_init__(self):
+        object.__setattr__(self, "description",
+                           f"{self.age}-year-old {self.gender} in {self.state}")
+        object.__setattr__(self, "portfolio_description",
+                           f"${self.initial_capital:,} total "
+                           f"(${self.traditional_401k:,} traditional 401k, "
+                           f"${self.roth_ira:,} Roth IRA, "
+                           f"${self.taxable:,} taxable)")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationResult:
     """Results from a simulation run."""
     strategy: str
@@ -59,20 +93,17 @@ class SimulationResult:
     p5_final: float
     p95_final: float
 
-    @property
-    def success_pct(self) -> str:
-        return f"{self.success_rate * 100:.1f}%"
-
-    @property
-    def median_final_fmt(self) -> str:
-        return f"${self.median_final:,.0f}"
+    success_pct: str = _fmt()
+    median_final_fmt: str = _fmt()
+    taxes_fmt: str = _fmt()
 
-    @property
-    def taxes_fmt(self) -> str:
-        return f"${self.total_taxes_median:,.0f}"
+    def __post_init__(self):
+        object.__setattr__(self, "success_pct", f"{self.success_rate * 100:.1f}%")
+        object.__setattr__(self, "median_final_fmt", f"${self.median_final:,.0f}")
+        object.__setattr__(self, "taxes_fmt", f"${self.total_taxes_median:,.0f}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyComparison:
     """Comparison of withdrawal strategies."""
     taxable_first: SimulationResult = None
@@ -80,22 +111,23 @@ class StrategyComparison:
     roth_first: SimulationResult = None
     pro_rata: SimulationResult = None
 
-    @property
-    def best_success(self) -> str:
+    best_success: str = _fmt()
+    tax_savings_traditional_vs_taxable: str = _fmt()
+
+    def __post_init__(self):
         strategies = [self.taxable_first, self.traditional_first,
-                     self.roth_first, self.pro_rata]
+                      self.roth_first, self.pro_rata]
         best = max(strategies, key=lambda x: x.success_rate if x else 0)
-        return best.strategy if best else "N/A"
+        object.__setattr__(self, "best_success", best.strategy if best else "N/A")
 
-    @property
-    def tax_savings_traditional_vs_taxable(self) -> str:
+        savings = "N/A"
         if self.taxable_first and self.traditional_first:
             diff = self.taxable_first.total_taxes_median - self.traditional_first.total_taxes_median
-            return f"${diff:,.0f}"
-        return "N/A"
+            savings = f"${diff:,.0f}"
+        object.__setattr__(self, "tax_savings_traditional_vs_taxable", savings)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaxBracketInflation:
     """Demonstrates bracket inflation over time."""
     income: int = 100_000
@@ -103,15 +135,27 @@ class TaxBracketInflation:
     tax_2035: float = 0
     tax_2045: float = 0
 
-    @property
-    def reduction_2045(self) -> str:
+    # Total tax over an income grid, for plotting the effect as a curve
+    incomes: tuple[float, ...] = field(default=(), repr=False)
+    taxes_2025: tuple[float, ...] = field(default=(), repr=False)
+    taxes_2035: tuple[float, ...] = field(default=(), repr=False)
+    taxes_2045: tuple[float, ...] = field(default=(), repr=False)
+
+    reduction_2045: str = _fmt()
+
+    def __post_init__(self):
+        # Tuples (not lists or arrays) keep instances hashable and comparable,
+        # including after a round trip through the JSON payload
+        for name in ("incomes", "taxes_2025", "taxes_2035", "taxes_2045"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        reduction = "N/A"
         if self.tax_2025 > 0:
             pct = (self.tax_2025 - self.tax_2045) / self.tax_2025 * 100
-            return f"{pct:.0f}%"
-        return "N/A"
+            reduction = f"{pct:.0f}%"
+        object.__setattr__(self, "reduction_2045", reduction)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RMDExample:
     """RMD calculation example."""
     age: int = 75
@@ -119,16 +163,16 @@ class RMDExample:
     divisor: float = 24.6
     rmd_amount: float = 0
 
-    @property
-    def rmd_fmt(self) -> str:
-        return f"${self.rmd_amount:,.0f}"
+    rmd_fmt: str = _fmt()
+    calculation: str = _fmt()
 
-    @property
-    def calculation(self) -> str:
-        return f"${self.traditional_balance:,} ÷ {self.divisor} = ${self.rmd_amount:,.0f}"
+    def __post_init__(self):
+        object.__setattr__(self, "rmd_fmt", f"${self.rmd_amount:,.0f}")
+        object.__setattr__(self, "calculation",
+                           f"${self.traditional_balance:,} ÷ {self.divisor} = ${self.rmd_amount:,.0f}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MortalitySummary:
     """Mortality table summary statistics."""
     male_life_expectancy_65: float = 0
@@ -136,16 +180,15 @@ class MortalitySummary:
     male_prob_survive_85: float = 0
     female_prob_survive_85: float = 0
 
-    @property
-    def male_le_fmt(self) -> str:
-        return f"{self.male_life_expectancy_65:.1f} years"
+    male_le_fmt: str = _fmt()
+    female_le_fmt: str = _fmt()
 
-    @property
-    def female_le_fmt(self) -> str:
-        return f"{self.female_life_expectancy_65:.1f} years"
+    def __post_init__(self):
+        object.__setattr__(self, "male_le_fmt", f"{self.male_life_expectancy_65:.1f} years")
+        object.__setattr__(self, "female_le_fmt", f"{self.female_life_expectancy_65:.1f} years")
 
 
-@dataclass
+@dataclass(slots=True)
 class Results:
     """All computed results for the paper."""
     reference: ReferenceCase = field(default_factory=ReferenceCase)
@@ -163,6 +206,9 @@ class Results:
     bond_mean_return: float = 0.03
     bond_std: float = 0.06
 
+    # True when the simulation modules were unavailable and values are stand-ins
+    placeholder: bool = False
+
     @property
     def stock_return_fmt(self) -> str:
         return f"{self.stock_mean_return * 100:.0f}%"
@@ -172,102 +218,83 @@ class Results:
         return f"{self.bond_mean_return * 100:.0f}%"
 
 
-def compute_results() -> Results:
-    """Compute all results for the paper."""
-    r = Results()
-
+@contextmanager
+def _api_importable():
+    """Put the API package on sys.path only while it's being used."""
+    sys.path.insert(0, str(api_path))
     try:
-        from eggnest.models import SimulationInput, Holding
+        yield
+    finally:
+        sys.path.remove(str(api_path))
+
+
+@lru_cache(maxsize=1)
+def _backend() -> SimpleNamespace | None:
+    """Import the simulation modules once; None when they're unavailable."""
+    with _api_importable():
+        try:
+            from eggnest.models import Holding, SimulationInput
+            from eggnest.rmd import get_rmd_divisor
+            from policyengine_us import Simulation
+        except ImportError as e:
+            print(f"Warning: Could not import simulation modules: {e}")
+            return None
+    return SimpleNamespace(
+        Holding=Holding,
+        SimulationInput=SimulationInput,
+        get_rmd_divisor=get_rmd_divisor,
+        Simulation=Simulation,
+    )
+
+
+def _run_simulation(params: Any, seed: int) -> Any:
+    """Run one strategy's Monte Carlo simulation (in a worker process)."""
+    with _api_importable():
         from eggnest.simulation import MonteCarloSimulator
-        from eggnest.rmd import RMD_START_AGE, get_rmd_divisor
-        from policyengine_us import Simulation
-
-        ref = r.reference
-
-        # Create holdings
-        holdings = [
-            Holding(account_type="traditional_401k", fund="sp500", balance=ref.traditional_401k),
-            Holding(account_type="roth_ira", fund="vt", balance=ref.roth_ira),
-            Holding(account_type="taxable", fund="bnd", balance=ref.taxable),
-        ]
-
-        # Run simulations for each strategy
-        strategies = ["taxable_first", "traditional_first", "roth_first", "pro_rata"]
-        results = {}
-
-        for strategy in strategies:
-            params = SimulationInput(
-                holdings=holdings,
-                withdrawal_strategy=strategy,
-                annual_spending=ref.annual_spending,
-                current_age=ref.age,
-                retirement_age=ref.retirement_age,
-                max_age=ref.max_age,
-                gender=ref.gender,
-                state=ref.state,
-                filing_status=ref.filing_status,
-                social_security_monthly=ref.social_security_monthly,
-                social_security_start_age=ref.social_security_start_age,
-                n_simulations=1000,  # Reduced for paper generation speed
-            )
 
-            sim = MonteCarloSimulator(params)
-            result = sim.run()
+        return MonteCarloSimulator(params, seed=seed).run()
+
+
+@lru_cache(maxsize=8)
+def _bracket_simulation(years: tuple[int, ...], age: int, state: str) -> Any:
+    """
+    PolicyEngine simulation of one person with employment income on a grid.
+
+    The same situation holds in every year, with parallel axes sweeping
+    employment income from $50k to $500k in $5k steps. Building the tax
+    system is the expensive part, so simulations are cached per process.
+    """
+    return _backend().Simulation(
+        situation={
+            "people": {"person": {
+                "age": {year: age for year in years},
+            }},
+            "tax_units": {"tax_unit": {"members": ["person"]}},
+            "households": {"household": {
+                "members": ["person"],
+                "state_code": {year: state for year in years},
+            }},
+            "axes": [[
+                {"name": "employment_income", "count": 91, "min": 50_000, "max": 500_000, "period": year}
+                for year in years
+            ]],
+        }
+    )
 
-            results[strategy] = SimulationResult(
-                strategy=strategy.replace("_", " ").title(),
-                success_rate=result.success_rate,
-                median_final=result.median_final_value,
-                total_taxes_median=result.total_taxes_median,
-                p5_final=result.percentile_paths.p5[-1] if hasattr(result, 'percentile_paths') else 0,
-                p95_final=result.percentile_paths.p95[-1] if hasattr(result, 'percentile_paths') else 0,
-            )
 
-        r.strategies = StrategyComparison(
-            taxable_first=results.get("taxable_first"),
-            traditional_first=results.get("traditional_first"),
-            roth_first=results.get("roth_first"),
-            pro_rata=results.get("pro_rata"),
-        )
+def compute_results() -> Results:
+    """Compute all results for the paper."""
+    with _api_importable():
+        return _compute_results()
 
-        # Tax bracket inflation
-        income = 100_000
-        for year in [2025, 2035, 2045]:
-            sim = Simulation(
-                situation={
-                    "people": {"person": {"age": {year: 65}, "employment_income": {year: income}}},
-                    "tax_units": {"tax_unit": {"members": ["person"]}},
-                    "households": {"household": {"members": ["person"], "state_code": {year: "CA"}}},
-                }
-            )
-            fed_tax = float(sim.calculate("income_tax", year)[0])
-            state_tax = float(sim.calculate("ca_income_tax", year)[0])
-            total = fed_tax + state_tax
-
-            if year == 2025:
-                r.bracket_inflation.tax_2025 = total
-            elif year == 2035:
-                r.bracket_inflation.tax_2035 = total
-            else:
-                r.bracket_inflation.tax_2045 = total
-
-        r.bracket_inflation.income = income
-
-        # RMD example
-        r.rmd_example.age = 75
-        r.rmd_example.traditional_balance = 300_000
-        r.rmd_example.divisor = get_rmd_divisor(75)
-        r.rmd_example.rmd_amount = r.rmd_example.traditional_balance / r.rmd_example.divisor
-
-        # Mortality (hardcoded from SSA tables)
-        r.mortality.male_life_expectancy_65 = 18.2
-        r.mortality.female_life_expectancy_65 = 20.8
-        r.mortality.male_prob_survive_85 = 0.45
-        r.mortality.female_prob_survive_85 = 0.58
-
-    except ImportError as e:
-        print(f"Warning: Could not import simulation modules: {e}")
+
+def _compute_results() -> Results:
+    r = Results()
+    backend = _backend()
+
+    if backend is None:
         print("Using placeholder values")
+        r.placeholder = True
 
         # Placeholder values for when modules aren't available
         r.strategies = StrategyComparison(
@@ -279,15 +306,199 @@ def compute_results() -> Results:
         r.bracket_inflation = TaxBracketInflation(100000, 16950, 15140, 11919)
         r.rmd_example = RMDExample(75, 300000, 24.6, 12195)
         r.mortality = MortalitySummary(18.2, 20.8, 0.45, 0.58)
+        return r
+
+    ref = r.reference
+
+    # Create holdings
+    holdings = [
+        backend.Holding(account_type="traditional_401k", fund="sp500", balance=ref.traditional_401k),
+        backend.Holding(account_type="roth_ira", fund="vt", balance=ref.roth_ira),
+        backend.Holding(account_type="taxable", fund="bnd", balance=ref.taxable),
+    ]
+
+    # Run simulations for each strategy
+    strategies = ["taxable_first", "traditional_first", "roth_first", "pro_rata"]
+    results = {}
+
+    # The strategies share every other input, so build (and validate)
+    # them once and copy with only the strategy swapped
+    base = backend.SimulationInput(
+        holdings=holdings,
+        annual_spending=ref.annual_spending,
+        current_age=ref.age,
+        retirement_age=ref.retirement_age,
+        max_age=ref.max_age,
+        gender=ref.gender,
+        state=ref.state,
+        filing_status=ref.filing_status,
+        social_security_monthly=ref.social_security_monthly,
+        social_security_start_age=ref.social_security_start_age,
+        n_simulations=PAPER_N_SIMULATIONS,
+    )
+    inputs = {
+        strategy: base.model_copy(update={"withdrawal_strategy": strategy})
+        for strategy in strategies
+    }
+
+    # The strategies are independent, so each runs in its own process
+    with ProcessPoolExecutor(max_workers=len(strategies)) as pool:
+        futures = {
+            strategy: pool.submit(_run_simulation, params, PAPER_SEED)
+            for strategy, params in inputs.items()
+        }
+        for strategy, future in futures.items():
+            result = future.result()
+            results[strategy] = SimulationResult(
+                strategy=strategy.replace("_", " ").title(),
+                success_rate=result.success_rate,
+                median_final=result.median_final_value,
+                total_taxes_median=result.total_taxes_median,
+                p5_final=result.percentiles["p5"],
+                p95_final=result.percentiles["p95"],
+            )
+
+    r.strategies = StrategyComparison(
+        taxable_first=results.get("taxable_first"),
+        traditional_first=results.get("traditional_first"),
+        roth_first=results.get("roth_first"),
+        pro_rata=results.get("pro_rata"),
+    )
+
+    # Tax bracket inflation: the whole curve for all years comes from a
+    # single simulation build
+    income = 100_000
+    years = [2025, 2035, 2045]
+    sim = _bracket_simulation(tuple(years), age=65, state="CA")
+    incomes = sim.calculate("employment_income", years[0])
+    taxes = {
+        year: sim.calculate("income_tax", year) + sim.calculate("ca_income_tax", year)
+        for year in years
+    }
+    i = int(incomes.searchsorted(income))
+    r.bracket_inflation = TaxBracketInflation(
+        income=income,
+        tax_2025=float(taxes[2025][i]),
+        tax_2035=float(taxes[2035][i]),
+        tax_2045=float(taxes[2045][i]),
+        incomes=incomes.tolist(),
+        taxes_2025=taxes[2025].tolist(),
+        taxes_2035=taxes[2035].tolist(),
+        taxes_2045=taxes[2045].tolist(),
+    )
+
+    # RMD example
+    traditional_balance = 300_000
+    divisor = backend.get_rmd_divisor(75)
+    r.rmd_example = RMDExample(
+        age=75,
+        traditional_balance=traditional_balance,
+        divisor=divisor,
+        rmd_amount=traditional_balance / divisor,
+    )
+
+    # Mortality (hardcoded from SSA tables)
+    r.mortality = MortalitySummary(
+        male_life_expectancy_65=18.2,
+        female_life_expectancy_65=20.8,
+        male_prob_survive_85=0.45,
+        female_prob_survive_85=0.58,
+    )
 
     return r
 
 
-# Singleton instance for import
-r = compute_results()
+def _cache_path() -> Path:
+    """Cache file for the current reference case, path count and seed."""
+    key = repr(asdict(ReferenceCase())) + f"{PAPER_N_SIMULATIONS}:{PAPER_SEED}"
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / f"results-{digest}.pkl"
+
+
+def _source_mtime() -> float:
+    """Latest modification time of this module and the eggnest sources."""
+    sources = [Path(__file__), *(api_path / "eggnest").glob("*.py")]
+    return max(path.stat().st_mtime for path in sources)
+
+
+def _from_dict(cls: type, values: dict) -> Any:
+    """Build a result dataclass from its asdict() form, skipping derived fields."""
+    return cls(**{f.name: values[f.name] for f in fields(cls) if f.init})
+
+
+def results_from_payload(payload: dict) -> Results:
+    """Rebuild Results from the JSON payload written by --emit."""
+    strategies = {
+        f.name: _from_dict(SimulationResult, payload["strategies"][f.name])
+        if payload["strategies"][f.name] else None
+        for f in fields(StrategyComparison) if f.init
+    }
+    return _from_dict(Results, {
+        **payload,
+        "reference": _from_dict(ReferenceCase, payload["reference"]),
+        "strategies": StrategyComparison(**strategies),
+        "bracket_inflation": _from_dict(TaxBracketInflation, payload["bracket_inflation"]),
+        "rmd_example": _from_dict(RMDExample, payload["rmd_example"]),
+        "mortality": _from_dict(MortalitySummary, payload["mortality"]),
+    })
+
+
+def load_or_compute() -> Results:
+    """
+    Load emitted or cached results, computing and caching them on a miss.
+
+    An emitted payload (RESULTS_PAYLOAD) is used as-is. The pickle cache is
+    stale once this module or any eggnest source is newer than it. Set
+    EGGNEST_FORCE_RECOMPUTE=1 to ignore both.
+    """
+    path = _cache_path()
+    if not os.environ.get("EGGNEST_FORCE_RECOMPUTE"):
+        if RESULTS_PAYLOAD.exists():
+            with RESULTS_PAYLOAD.open() as f:
+                return results_from_payload(json.load(f))
+        try:
+            if path.stat().st_mtime > _source_mtime():
+                with path.open("rb") as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+            pass
+
+    results = compute_results()
+    if not results.placeholder:
+        # Write to a temporary file and rename, so readers never see a
+        # partial pickle
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    return results
+
+
+def __getattr__(name: str) -> Any:
+    """Compute the `r` singleton on first access, not at import."""
+    if name == "r":
+        globals()["r"] = load_or_compute()
+        return globals()["r"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--emit", type=Path, metavar="PATH",
+                        help="recompute and write results as JSON (the paper reads docs/_static/results.json)")
+    args = parser.parse_args()
+
+    # Emitting always recomputes, so a stale payload is never re-emitted
+    r = compute_results() if args.emit else load_or_compute()
+    if args.emit:
+        if r.placeholder:
+            sys.exit("Not emitting placeholder results")
+        args.emit.parent.mkdir(parents=True, exist_ok=True)
+        args.emit.write_text(json.dumps(asdict(r), indent=2, ensure_ascii=False) + "\n")
+        print(f"Wrote {args.emit}")
+        sys.exit()
+
     print("EggNest Paper Results")
     print("=" * 50)
     print(f"\nReference Case: {r.reference.description}")